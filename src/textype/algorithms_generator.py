@@ -5,12 +5,12 @@ for different typing practice patterns (isolation, adjacency, alternating,
 mirroring, rolls, and pseudo-words).
 """
 import random
-from typing import List
+from typing import List, Sequence
 from textype.keyboard import PhysicalKey, RowLayout
 
 
 def single_key_repeat(
-    keys: List[PhysicalKey], reps: int = 4, shuffle: bool = True
+    keys: Sequence[PhysicalKey], reps: int = 4, shuffle: bool = True
 ) -> List[PhysicalKey]:
     """Generate sequence for single key repetition practice.
 
@@ -18,7 +18,7 @@ def single_key_repeat(
     times before moving to the next key.
 
     Args:
-        keys: List of physical keys to practice
+        keys: Sequence of physical keys to practice
         reps: Number of repetitions per key (default: 4)
         shuffle: Whether to shuffle the order of keys (default: True)
 
@@ -32,7 +32,7 @@ def single_key_repeat(
         >>> len(seq)
         11  # 4 keys * 2 reps + 3 spaces (last space removed)
     """
-    pool = keys[:]
+    pool = list(keys)
     if shuffle:
         random.shuffle(pool)
 
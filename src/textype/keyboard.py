@@ -4,7 +4,8 @@ This module defines the physical keyboard layout, key mappings, and finger
 assignments used for visualization and practice generation.
 """
 from enum import Enum
-from typing import Dict, List, TypedDict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, TypedDict
 
 
 class PhysicalKey(Enum):
@@ -83,8 +84,8 @@ class PhysicalKey(Enum):
     KEY_SPACE = 57
 
 
-KEYBOARD_ROWS: List[List[PhysicalKey]] = [
-    [
+KEYBOARD_ROWS: Tuple[Tuple[PhysicalKey, ...], ...] = (
+    (
         PhysicalKey.KEY_ESCAPE,
         PhysicalKey.KEY_TILDE,
         PhysicalKey.KEY_1,
@@ -100,8 +101,8 @@ KEYBOARD_ROWS: List[List[PhysicalKey]] = [
         PhysicalKey.KEY_MINUS,
         PhysicalKey.KEY_EQUAL,
         PhysicalKey.KEY_BACKSPACE,
-    ],
-    [
+    ),
+    (
         PhysicalKey.KEY_TAB,
         PhysicalKey.KEY_Q,
         PhysicalKey.KEY_W,
@@ -116,8 +117,8 @@ KEYBOARD_ROWS: List[List[PhysicalKey]] = [
         PhysicalKey.KEY_LEFT_BRACKET,
         PhysicalKey.KEY_RIGHT_BRACKET,
         PhysicalKey.KEY_BACKSLASH,
-    ],
-    [
+    ),
+    (
         PhysicalKey.KEY_A,
         PhysicalKey.KEY_S,
         PhysicalKey.KEY_D,
@@ -130,8 +131,8 @@ KEYBOARD_ROWS: List[List[PhysicalKey]] = [
         PhysicalKey.KEY_SEMICOLON,
         PhysicalKey.KEY_QUOTE,
         PhysicalKey.KEY_ENTER,
-    ],
-    [
+    ),
+    (
         PhysicalKey.KEY_SHIFT_LEFT,
         PhysicalKey.KEY_Z,
         PhysicalKey.KEY_X,
@@ -144,78 +145,48 @@ KEYBOARD_ROWS: List[List[PhysicalKey]] = [
         PhysicalKey.KEY_DOT,
         PhysicalKey.KEY_SLASH,
         PhysicalKey.KEY_SHIFT_RIGHT,
-    ],
-    [
-        PhysicalKey.KEY_SPACE,
-    ],
-]
+    ),
+    (PhysicalKey.KEY_SPACE,),
+)
 """Physical keyboard layout organized by rows for visualization.
 
-Each inner list represents a row of keys from left to right.
+Each inner tuple represents a row of keys from left to right.
 Rows are: number row, top row, home row, bottom row, space bar row.
 """
 
-FINGER_MAP: Dict[PhysicalKey, str] = {
-    # Number row
-    # Numbers
-    PhysicalKey.KEY_TILDE: "L1",
-    PhysicalKey.KEY_1: "L1",
-    PhysicalKey.KEY_2: "L2",
-    PhysicalKey.KEY_3: "L3",
-    PhysicalKey.KEY_4: "L4",
-    PhysicalKey.KEY_5: "L4",
-    PhysicalKey.KEY_6: "R1",
-    PhysicalKey.KEY_7: "R1",
-    PhysicalKey.KEY_8: "R2",
-    PhysicalKey.KEY_9: "R3",
-    PhysicalKey.KEY_0: "R4",
-    PhysicalKey.KEY_MINUS: "R4",
-    PhysicalKey.KEY_EQUAL: "R4",
-    PhysicalKey.KEY_BACKSPACE: "R4",
-    # Top row
-    PhysicalKey.KEY_TAB: "L1",
-    PhysicalKey.KEY_Q: "L1",
-    PhysicalKey.KEY_W: "L2",
-    PhysicalKey.KEY_E: "L3",
-    PhysicalKey.KEY_R: "L4",
-    PhysicalKey.KEY_T: "L4",
-    PhysicalKey.KEY_Y: "R1",
-    PhysicalKey.KEY_U: "R1",
-    PhysicalKey.KEY_I: "R2",
-    PhysicalKey.KEY_O: "R3",
-    PhysicalKey.KEY_P: "R4",
-    PhysicalKey.KEY_LEFT_BRACKET: "R4",
-    PhysicalKey.KEY_RIGHT_BRACKET: "R4",
-    PhysicalKey.KEY_BACKSLASH: "R4",
-    # Home row
-    PhysicalKey.KEY_A: "L1",
-    PhysicalKey.KEY_S: "L2",
-    PhysicalKey.KEY_D: "L3",
-    PhysicalKey.KEY_F: "L4",
-    PhysicalKey.KEY_G: "L4",
-    PhysicalKey.KEY_H: "R1",
-    PhysicalKey.KEY_J: "R1",
-    PhysicalKey.KEY_K: "R2",
-    PhysicalKey.KEY_L: "R3",
-    PhysicalKey.KEY_SEMICOLON: "R4",
-    PhysicalKey.KEY_QUOTE: "R4",
-    PhysicalKey.KEY_ENTER: "R4",
-    # Bottom row
-    PhysicalKey.KEY_SHIFT_LEFT: "L1",
-    PhysicalKey.KEY_Z: "L1",
-    PhysicalKey.KEY_X: "L2",
-    PhysicalKey.KEY_C: "L3",
-    PhysicalKey.KEY_V: "L4",
-    PhysicalKey.KEY_B: "L4",
-    PhysicalKey.KEY_N: "R1",
-    PhysicalKey.KEY_M: "R1",
-    PhysicalKey.KEY_COMMA: "R2",
-    PhysicalKey.KEY_DOT: "R3",
-    PhysicalKey.KEY_SLASH: "R4",
-    PhysicalKey.KEY_SHIFT_RIGHT: "R4",
-    PhysicalKey.KEY_SPACE: "THUMB",
-}
-"""Mapping from physical keys to finger assignments for touch typing.
+_FINGER_COLUMNS: Tuple[str, ...] = (
+    "L1",
+    "L2",
+    "L3",
+    "L4",
+    "L4",
+    "R1",
+    "R1",
+    "R2",
+    "R3",
+    "R4",
+)
+"""Finger for each of the ten main-block columns ("1"-"0", "Q"-"P", ...)."""
+
+_ROW_FIRST_COLUMN: Tuple[int, ...] = (2, 1, 0, 1)
+"""Index of the first main-block key ("1", "Q", "A", "Z") in each KEYBOARD_ROWS row.
+
+Keys left of the main block go to the left pinky and keys right of it to the
+right pinky, so they clamp to the first and last column.
+"""
+
+FINGER_MAP: Mapping[PhysicalKey, str] = MappingProxyType(
+    {
+        **{
+            key: _FINGER_COLUMNS[min(max(i - first, 0), len(_FINGER_COLUMNS) - 1)]
+            for row, first in zip(KEYBOARD_ROWS, _ROW_FIRST_COLUMN)
+            for i, key in enumerate(row)
+            if key is not PhysicalKey.KEY_ESCAPE
+        },
+        PhysicalKey.KEY_SPACE: "THUMB",
+    }
+)
+"""Read-only mapping from physical keys to finger assignments for touch typing.
 
 Keys:
 - L1-L4: Left hand fingers (pinky to index)
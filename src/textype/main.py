@@ -6,12 +6,14 @@ the typing practice sessions, UI interactions, and user progress tracking.
 import asyncio
 import time
 import random
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, ClassVar
 from textual.app import App, ComposeResult
+from textual.widget import Widget
 from textual.widgets import Header, Footer, Static
 from textual.containers import Vertical, Horizontal
 from textual.binding import Binding
 from textual import events
+from textual.css.query import NoMatches
 from rich.text import Text
 
 import textype.code_generator as code_generator
@@ -23,13 +25,53 @@ from textype.keyboard import PhysicalKey, KEYBOARD_ROWS, FINGER_MAP, DISPLAY_MAP
 from textype.models import UserProfile, FINGER_HEIGHTS
 from textype.sentence_generator import generate_sentence, generate_sentence_async
 from textype.widgets import (
-    FingerColumn,
+    FingerRow,
     StatsScreen,
     ProfileSelectScreen,
     ProfileInfoScreen,
 )
 from textype.xkb_resolver import XKBResolver
 
+_row_all_cache: Dict[str, Tuple[PhysicalKey, ...]] = {}
+"""Combined left + right hand keys per LAYOUT row, built on first use."""
+
+
+def _build_highlight_selectors() -> Dict[PhysicalKey, Tuple[str, str, str, str]]:
+    """Precompute the widget selectors used to highlight each key.
+
+    Returns:
+        Mapping of physical key to (key selector, finger id, shift key
+        selector, shift finger id). Finger and shift entries are empty
+        strings for keys without a finger assignment. Left-hand keys pair with
+        the right shift and vice versa.
+    """
+    selectors: Dict[PhysicalKey, Tuple[str, str, str, str]] = {}
+    for key in PhysicalKey:
+        fid = FINGER_MAP.get(key, "")
+        if not fid:
+            shift_key, shift_finger = "", ""
+        elif fid.startswith("L"):
+            shift_key, shift_finger = f"#key-{PhysicalKey.KEY_SHIFT_RIGHT.name}", "R4"
+        else:
+            shift_key, shift_finger = f"#key-{PhysicalKey.KEY_SHIFT_LEFT.name}", "L1"
+        selectors[key] = (
+            f"#key-{key.name}",
+            fid,
+            shift_key,
+            shift_finger,
+        )
+    return selectors
+
+
+_CORRECT_STYLE = "#9ece6a"
+_ERROR_STYLE = "#f7768e"
+_CURSOR_STYLE = "reverse"
+
+_HIGHLIGHT_SELECTORS: Dict[PhysicalKey, Tuple[str, str, str, str]] = (
+    _build_highlight_selectors()
+)
+"""Per-key widget selectors and finger ids for the current key/finger highlight."""
+
 
 class TypingTutor(App):
     """Main Textype typing tutor application.
@@ -40,7 +82,7 @@ class TypingTutor(App):
     Attributes:
         target_text: The text the user should type
         typed_text: The text the user has typed so far
-        session_start_time: When the current session started
+        session_start_time: When the current session started (time.monotonic)
         session_active: Whether a session is currently in progress
         cumulative_typed_chars: Total characters typed in session
         cumulative_errors: Total errors made in session
@@ -55,6 +97,9 @@ class TypingTutor(App):
 
     CSS_PATH = "styles.tcss"
 
+    _key_label_cache: ClassVar[Optional[Dict[PhysicalKey, str]]] = None
+    """Display labels for every physical key, built on first instantiation."""
+
     BINDINGS = [
         Binding("f1", "toggle_keyboard", "Toggle Keys"),
         Binding("f2", "toggle_fingers", "Toggle Fingers"),
@@ -83,6 +128,23 @@ class TypingTutor(App):
         self.current_chunk_errors: int = 0
         self.chunks_completed: int = 0  # Track chunks for shuffle logic
 
+        # Last formatted timer value, reused until the displayed second changes
+        self._cached_timer_secs: int = -1
+        self._cached_timer_str: str = ""
+
+        # Last accuracy value, keyed on the (chars, errors) it was computed from
+        self._cached_acc_inputs: Tuple[int, int] = (-1, -1)
+        self._cached_acc: int = 0
+
+        # Style runs of the typed prefix as (start index, style), covering
+        # the first _styled_len characters of _styled_target
+        self._typed_runs: List[Tuple[int, str]] = []
+        self._styled_len: int = 0
+        self._styled_target: str = ""
+
+        # Widgets currently carrying a highlight class, cleared on next refresh
+        self._highlighted: List[Tuple[Widget, str]] = []
+
         self.profile: Optional[UserProfile] = None
         self.show_stats_pref: bool = self._get_config("SHOW_STATS_ON_END")
         self.resolver: XKBResolver = XKBResolver()
@@ -109,8 +171,10 @@ class TypingTutor(App):
             PhysicalKey, Tuple[Optional[str], Optional[str]]
         ] = {}
 
-        # Cache for keyboard key labels
-        self._key_label_cache: Dict[PhysicalKey, str] = self._build_key_label_cache()
+        # Keyboard key labels only depend on the system layout, so resolve
+        # them once per process and share across app instances
+        if TypingTutor._key_label_cache is None:
+            TypingTutor._key_label_cache = self._build_key_label_cache()
 
     def _get_config(self, key: str) -> Any:
         """Get configuration value from profile or fallback to default."""
@@ -136,12 +200,12 @@ class TypingTutor(App):
             # Keyboard UI with initial visibility check
             kb_classes = "" if self._get_config("SHOW_QWERTY") else "hidden"
 
+            labels = self._key_label_cache
             with Vertical(id="keyboard-section", classes=kb_classes):
                 for row in KEYBOARD_ROWS:
                     with Horizontal(classes="key-row"):
                         for key in row:
-                            # Use cached label
-                            label = self._key_label_cache.get(key, "")
+                            label = labels[key]
                             special_class = " special-key" if key in DISPLAY_MAP else ""
 
                             yield Static(
@@ -154,18 +218,42 @@ class TypingTutor(App):
             fg_classes = "" if self._get_config("SHOW_FINGERS") else "hidden"
             with Horizontal(id="finger-guide-wrapper", classes=fg_classes):
                 with Horizontal(id="finger-guide"):
-                    for fid, dimensions in FINGER_HEIGHTS.items():
-                        yield FingerColumn(
-                            fid, dimensions.height, dimensions.width
-                        )  # (h, w)
+                    yield FingerRow(FINGER_HEIGHTS, id="finger-row")
 
         yield Footer()
 
     def on_mount(self) -> None:
         """Initialize the application after mounting.
 
-        Shows the profile selection screen and starts the timer update interval.
+        Caches references to the statically-identified widgets, shows the
+        profile selection screen and starts the timer update interval.
         """
+        self._stats_bar: Static = self.query_one("#stats-bar", Static)
+        self._typing_area: Static = self.query_one("#typing-area", Static)
+        self._keyboard_section: Vertical = self.query_one("#keyboard-section", Vertical)
+        self._finger_wrapper: Horizontal = self.query_one(
+            "#finger-guide-wrapper", Horizontal
+        )
+        self._finger_row: FingerRow = self.query_one("#finger-row", FingerRow)
+
+        # Resolve every highlight selector to its widget once, so keystrokes
+        # only do a dict lookup instead of a DOM query
+        widgets: Dict[str, Optional[Widget]] = {}
+        for key_sel, _, shift_sel, _ in _HIGHLIGHT_SELECTORS.values():
+            for selector in (key_sel, shift_sel):
+                if selector in widgets:
+                    continue
+                try:
+                    widgets[selector] = self.query_one(selector) if selector else None
+                except NoMatches:
+                    widgets[selector] = None
+        self._highlight_widgets: Dict[
+            PhysicalKey, Tuple[Optional[Widget], str, Optional[Widget], str]
+        ] = {
+            key: (widgets[sels[0]], sels[1], widgets[sels[2]], sels[3])
+            for key, sels in _HIGHLIGHT_SELECTORS.items()
+        }
+
         self.action_switch_profile()
         self.set_interval(0.5, self.update_timer)
 
@@ -176,11 +264,11 @@ class TypingTutor(App):
         when the drill duration is reached.
         """
         if self.session_active and self.session_start_time:
-            elapsed = time.time() - self.session_start_time
+            elapsed = time.monotonic() - self.session_start_time
             if elapsed >= self._get_config("DRILL_DURATION"):
                 self.end_drill_session()
             else:
-                self.refresh_display()
+                self.refresh_stats_bar()
 
     # Toggles for UI elements
     def action_toggle_keyboard(self) -> None:
@@ -188,14 +276,14 @@ class TypingTutor(App):
 
         Bound to F1 key.
         """
-        self.query_one("#keyboard-section").toggle_class("hidden")
+        self._keyboard_section.toggle_class("hidden")
 
     def action_toggle_fingers(self) -> None:
         """Toggle finger guide visualization visibility.
 
         Bound to F2 key.
         """
-        self.query_one("#finger-guide-wrapper").toggle_class("hidden")
+        self._finger_wrapper.toggle_class("hidden")
 
     def action_toggle_stats_pref(self) -> None:
         """Toggle whether stats show automatically at the end.
@@ -225,7 +313,7 @@ class TypingTutor(App):
             new_mode = "code"
         else:
             new_mode = "curriculum"
-        self.profile.config_overrides["PRACTICE_MODE"] = new_mode
+        self.profile.set_override("PRACTICE_MODE", new_mode)
         self.profile.save()
 
         if new_mode == "sentences":
@@ -329,6 +417,7 @@ class TypingTutor(App):
             elif action == "saved":
                 # Configuration saved, apply changes
                 self.apply_profile_config()
+                self.refresh_stats_bar()
                 self.notify(f"Profile configuration saved for {name}")
 
                 # Check if practice mode changed and restart session if needed
@@ -351,17 +440,13 @@ class TypingTutor(App):
         profile before exiting.
         """
         if self.profile:
-            kb_visible = not self.query_one("#keyboard-section").has_class("hidden")
-            fg_visible = not self.query_one("#finger-guide-wrapper").has_class("hidden")
+            kb_visible = not self._keyboard_section.has_class("hidden")
+            fg_visible = not self._finger_wrapper.has_class("hidden")
 
             # 2. Update profile overrides
-            self.profile.config_overrides.update(
-                {
-                    "SHOW_QWERTY": kb_visible,
-                    "SHOW_FINGERS": fg_visible,
-                    "SHOW_STATS_ON_END": self.show_stats_pref,
-                }
-            )
+            self.profile.set_override("SHOW_QWERTY", kb_visible)
+            self.profile.set_override("SHOW_FINGERS", fg_visible)
+            self.profile.set_override("SHOW_STATS_ON_END", self.show_stats_pref)
 
             # 3. Persist to disk
             self.profile.save()
@@ -458,7 +543,7 @@ class TypingTutor(App):
                 is_correct = True
 
             if not self.session_start_time:
-                self.session_start_time = time.time()
+                self.session_start_time = time.monotonic()
 
             if is_correct:
                 self.typed_text += char  # Add the *actual* char typed
@@ -467,8 +552,10 @@ class TypingTutor(App):
                 if not self._get_config("HARD_MODE"):
                     self.typed_text += char
 
+        # Loading the next chunk refreshes the display itself
+        if self.check_chunk_completion():
+            return
         self.refresh_display()
-        self.check_chunk_completion()
 
     def refresh_display(self) -> None:
         """Refresh the UI with current session state.
@@ -476,20 +563,18 @@ class TypingTutor(App):
         Updates the statistics bar, typing area highlighting, and
         visual feedback for the current key and finger.
         """
-        # Calculate time and statistics
+        self.refresh_stats_bar()
+        self.refresh_typing_area()
+        self.refresh_highlights()
+
+    def refresh_stats_bar(self) -> None:
+        """Update the statistics bar with timer, WPM, accuracy and mode."""
         elapsed, remaining = self._calculate_session_time()
         timer_str = self._format_timer(remaining)
         wpm, acc = self._calculate_statistics(elapsed)
 
-        # Update header with mode information
         status_text = self._build_status_text(timer_str, wpm, acc)
-        self.query_one("#stats-bar").update(status_text)
-
-        # Update typing area with highlighting
-        self._update_typing_area()
-
-        # Highlight current key and finger
-        self._highlight_current_key_and_finger()
+        self._stats_bar.update(status_text)
 
     def _calculate_session_time(self) -> Tuple[float, float]:
         """Calculate elapsed and remaining session time.
@@ -498,7 +583,7 @@ class TypingTutor(App):
             Tuple of (elapsed_time, remaining_time) in seconds
         """
         if self.session_start_time and self.session_active:
-            elapsed = time.time() - self.session_start_time
+            elapsed = time.monotonic() - self.session_start_time
             remaining = max(0, self._get_config("DRILL_DURATION") - elapsed)
         else:
             elapsed = 0
@@ -512,10 +597,16 @@ class TypingTutor(App):
             remaining: Remaining time in seconds
 
         Returns:
-            Formatted timer string (MM:SS)
+            Formatted timer string (MM:SS), reused while the whole-second
+            value is unchanged
         """
-        mins, secs = divmod(int(remaining), 60)
-        return f"{mins:02}:{secs:02}"
+        remaining_secs = int(remaining)
+        if remaining_secs != self._cached_timer_secs:
+            self._cached_timer_secs = remaining_secs
+            self._cached_timer_str = (
+                f"{remaining_secs // 60:02}:{remaining_secs % 60:02}"
+            )
+        return self._cached_timer_str
 
     def _calculate_statistics(self, elapsed: float) -> Tuple[int, int]:
         """Calculate typing statistics.
@@ -529,14 +620,21 @@ class TypingTutor(App):
         total_chars = self.cumulative_typed_chars + len(self.typed_text)
         total_errs = self.cumulative_errors + self.current_chunk_errors
 
-        # Avoid division by zero
-        safe_elapsed = elapsed if elapsed > 0 else 1e-6
-        wpm = round((total_chars / 5) / (safe_elapsed / 60)) if elapsed > 0 else 0
-
-        acc = round(
-            ((total_chars - total_errs) / max(1, total_chars + total_errs)) * 100
+        # Integer arithmetic: (chars / 5) / (secs / 60) == chars * 12000 / ms,
+        # rounded half-up as (2n + d) // 2d
+        elapsed_ms = int(elapsed * 1000)
+        wpm = (
+            (24000 * total_chars + elapsed_ms) // (2 * elapsed_ms)
+            if elapsed_ms > 0
+            else 0
         )
-        return wpm, acc
+
+        # Timer ticks recompute WPM but usually leave accuracy inputs unchanged
+        if (total_chars, total_errs) != self._cached_acc_inputs:
+            self._cached_acc_inputs = (total_chars, total_errs)
+            ops = max(1, total_chars + total_errs)
+            self._cached_acc = (200 * (total_chars - total_errs) + ops) // (2 * ops)
+        return wpm, self._cached_acc
 
     def _build_status_text(self, timer_str: str, wpm: int, acc: int) -> str:
         """Build the status text for the stats bar.
@@ -606,91 +704,82 @@ class TypingTutor(App):
 
         return mode_display
 
-    def _update_typing_area(self) -> None:
+    def refresh_typing_area(self) -> None:
         """Update the typing area with highlighting for typed vs target text."""
-        rich_text = Text("")
-        for i, c in enumerate(self.target_text):
-            if i < len(self.typed_text):
-                style = "#9ece6a" if self.typed_text[i] == c else "#f7768e"
-                rich_text.append(c, style=style)
-            elif i == len(self.typed_text):
-                rich_text.append(c, style="reverse")
-            else:
-                rich_text.append(c)
-
-        self.query_one("#typing-area").update(rich_text)
-
-    def _highlight_current_key_and_finger(self) -> None:
-        """Highlight the current key and finger in the UI."""
-        self.query(".key").remove_class("active-key")
-        self.query(".finger-body").remove_class("active-finger")
+        target = self.target_text
+        typed = self.typed_text
+        cursor = len(typed)
+
+        # Typing only ever appends or removes characters at the end, so the
+        # style runs of the typed prefix are updated for the characters that
+        # changed since the last refresh instead of being rebuilt
+        runs = self._typed_runs
+        if target is not self._styled_target:
+            runs.clear()
+            self._styled_len = 0
+            self._styled_target = target
+        while self._styled_len > cursor:
+            self._styled_len -= 1
+            if runs[-1][0] == self._styled_len:
+                runs.pop()
+        while self._styled_len < cursor:
+            i = self._styled_len
+            style = _CORRECT_STYLE if typed[i] == target[i] else _ERROR_STYLE
+            if not runs or runs[-1][1] != style:
+                runs.append((i, style))
+            self._styled_len += 1
+
+        parts: List[Tuple[str, str]] = [
+            (target[start : runs[n + 1][0] if n + 1 < len(runs) else cursor], style)
+            for n, (start, style) in enumerate(runs)
+        ]
+        if cursor < len(target):
+            parts.append((target[cursor], _CURSOR_STYLE))
+            parts.append((target[cursor + 1 :], ""))
+
+        self._typing_area.update(Text.assemble(*parts))
+
+    def refresh_highlights(self) -> None:
+        """Highlight the current key and finger in the UI.
+
+        Only the widgets highlighted by the previous call are cleared,
+        instead of querying every key widget. Fingers are highlighted
+        through the finger row, which repaints only the fingers that change.
+        """
+        for widget, class_name in self._highlighted:
+            widget.remove_class(class_name)
+        self._highlighted.clear()
 
         if len(self.typed_text) >= len(self.target_keys):
+            self._finger_row.set_active(())
             return
 
         physical_key = self.target_keys[len(self.typed_text)]
-        self._highlight_finger(physical_key)
-        self._highlight_keyboard_key(physical_key)
-        self._highlight_shift_if_needed(physical_key)
-
-    def _highlight_finger(self, physical_key: PhysicalKey) -> None:
-        """Highlight the finger corresponding to the current key.
-
-        Args:
-            physical_key: The current physical key
-        """
-        fid = FINGER_MAP.get(physical_key)
-        if fid:
-            try:
-                self.query_one(f"#{fid}").add_class("active-finger")
-            except Exception:
-                pass
+        key_w, fid, shift_key_w, shift_fid = self._highlight_widgets[physical_key]
+        active_fingers = [fid]
+        self._highlight(key_w, "active-key")
 
-    def _highlight_keyboard_key(self, physical_key: PhysicalKey) -> None:
-        """Highlight the keyboard key in the UI.
+        # If the target char matches the shifted version but NOT the base
+        # version, highlight the opposite-hand shift key and its finger.
+        target_char = self.target_text[len(self.typed_text)]
+        base_char, shifted_char = self._get_key_characters(physical_key)
+        if target_char == shifted_char and target_char != base_char:
+            self._highlight(shift_key_w, "active-key")
+            active_fingers.append(shift_fid)
 
-        Args:
-            physical_key: The current physical key
-        """
-        try:
-            self.query_one(f"#key-{physical_key.name}").add_class("active-key")
-        except Exception:
-            pass
+        self._finger_row.set_active(active_fingers)
 
-    def _highlight_shift_if_needed(self, physical_key: PhysicalKey) -> None:
-        """Highlight shift keys if the current character requires shift.
+    def _highlight(self, widget: Optional[Widget], class_name: str) -> None:
+        """Add a highlight class to a widget.
 
         Args:
-            physical_key: The current physical key
+            widget: Widget to highlight, or None for no widget
+            class_name: CSS class to add
         """
-        target_char = self.target_text[len(self.typed_text)]
-        base_char, shifted_char = self._get_key_characters(physical_key)
-
-        # If the target char matches the shifted version but NOT the base version, we need shift.
-        if target_char == shifted_char and target_char != base_char:
-            fid = FINGER_MAP.get(physical_key)
-
-            # Determine which shift (left or right) based on hand
-            # If key is Left hand (L1-L4), use Right Shift.
-            # If key is Right hand (R1-R4), use Left Shift.
-            if fid:
-                shift_id = (
-                    f"#key-{PhysicalKey.KEY_SHIFT_RIGHT.name}"
-                    if fid.startswith("L")
-                    else f"#key-{PhysicalKey.KEY_SHIFT_LEFT.name}"
-                )
-                # Highlight shift key on keyboard
-                try:
-                    self.query_one(shift_id).add_class("active-key")
-                except Exception:
-                    pass
-
-                # Highlight shift finger on finger guide
-                shift_finger = "R4" if fid.startswith("L") else "L1"
-                try:
-                    self.query_one(f"#{shift_finger}").add_class("active-finger")
-                except Exception:
-                    pass
+        if widget is None:
+            return
+        widget.add_class(class_name)
+        self._highlighted.append((widget, class_name))
 
     def _get_key_characters(
         self, physical_key: PhysicalKey
@@ -1033,15 +1122,20 @@ class TypingTutor(App):
         self.current_chunk_errors = 0
         self.refresh_display()
 
-    def check_chunk_completion(self) -> None:
+    def check_chunk_completion(self) -> bool:
         """Check if the current text chunk has been completed.
 
         Automatically loads the next chunk if the session is still active.
+
+        Returns:
+            True if the next chunk was loaded, False otherwise
         """
         if len(self.typed_text) == len(self.target_text):
             # If session is still active, load next chunk
             if self.session_active:
                 self.load_next_chunk()
+                return True
+        return False
 
     def end_drill_session(self) -> None:
         """End the current session and show statistics.
@@ -1081,13 +1175,14 @@ class TypingTutor(App):
         Returns:
             Tuple of (WPM, accuracy_percentage)
         """
-        elapsed = self._get_config("DRILL_DURATION") / 60  # Normalized to full duration
-        wpm = round((self.cumulative_typed_chars / 5) / elapsed)
-        total_ops = self.cumulative_typed_chars + self.cumulative_errors
-        acc = round(
-            ((self.cumulative_typed_chars - self.cumulative_errors) / max(1, total_ops))
-            * 100
-        )
+        typed = self.cumulative_typed_chars
+        errors = self.cumulative_errors
+        # Normalized to full duration
+        duration = max(1, int(self._get_config("DRILL_DURATION")))
+        ops = max(1, typed + errors)
+        # Rounded half-up as (2n + d) // 2d
+        wpm = (24 * typed + duration) // (2 * duration)
+        acc = (200 * (typed - errors) + ops) // (2 * ops)
         return wpm, acc
 
     def _evaluate_drill_performance(self, wpm: int, acc: int) -> bool:
@@ -1184,7 +1279,7 @@ class TypingTutor(App):
                 )
             else:
                 action_text = "[reverse] PRESS ENTER TO REPEAT LESSON [/]"
-            self.query_one("#typing-area").update(
+            self._typing_area.update(
                 f"\n[#9ece6a]SESSION COMPLETE[/]\n\n"
                 f"WPM: {wpm} | ACC: {acc}% | ERRORS: {self.cumulative_errors}\n\n"
                 f"{action_text}"
@@ -1199,12 +1294,8 @@ class TypingTutor(App):
         self.show_stats_pref = config["SHOW_STATS_ON_END"]
 
         # Update UI visibility
-        self.query_one("#keyboard-section").set_class(
-            not config["SHOW_QWERTY"], "hidden"
-        )
-        self.query_one("#finger-guide-wrapper").set_class(
-            not config["SHOW_FINGERS"], "hidden"
-        )
+        self._keyboard_section.set_class(not config["SHOW_QWERTY"], "hidden")
+        self._finger_wrapper.set_class(not config["SHOW_FINGERS"], "hidden")
 
     def generate_lesson_text(self) -> str:
         """Generate practice text for the current lesson.
@@ -1229,8 +1320,13 @@ class TypingTutor(App):
         row_key = lesson.get("row", "home")
         row_data = LAYOUT.get(row_key)
 
+        all_keys = _row_all_cache.get(row_key)
+        if all_keys is None:
+            all_keys = tuple(row_data["left"]) + tuple(row_data["right"])
+            _row_all_cache[row_key] = all_keys
+
         # Generate physical keys using appropriate algorithm
-        physical_keys = self._generate_physical_keys(algo_type, row_data)
+        physical_keys = self._generate_physical_keys(algo_type, row_data, all_keys)
         self.target_keys = physical_keys
 
         # Convert physical keys to characters
@@ -1248,13 +1344,14 @@ class TypingTutor(App):
         return sentence
 
     def _generate_physical_keys(
-        self, algo_type: str, row_data: Dict
+        self, algo_type: str, row_data: Dict, all_keys: Tuple[PhysicalKey, ...]
     ) -> List[PhysicalKey]:
         """Generate physical keys using the specified algorithm.
 
         Args:
             algo_type: Algorithm type (repeat, adjacent, alternating, etc.)
             row_data: Keyboard row layout data
+            all_keys: Left and right hand keys of the row combined
 
         Returns:
             List of physical keys for practice
@@ -1264,7 +1361,7 @@ class TypingTutor(App):
         # Algorithm strategy pattern
         algorithms = {
             "repeat": lambda: algos.single_key_repeat(
-                row_data["left"] + row_data["right"],
+                all_keys,
                 shuffle=should_shuffle,
             ),
             "adjacent": lambda: algos.same_hand_adjacent(
@@ -1291,8 +1388,7 @@ class TypingTutor(App):
             return generator()
         else:
             # Default: random keys
-            all_keys = row_data["left"] + row_data["right"]
-            return [random.choice(all_keys) for _ in range(40)]
+            return random.choices(all_keys, k=40)
 
     def _render_keys_to_text(
         self, physical_keys: List[PhysicalKey], shift_mode: str
@@ -5,11 +5,20 @@ for managing user progress and configuration.
 """
 import json
 import os
-from dataclasses import dataclass, asdict, field
-from typing import Dict, Any, List, Optional, Tuple
+import sys
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from platformdirs import user_data_dir, user_config_dir
 from collections import namedtuple
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 PROFILES_DIR: str = user_data_dir("textype")
 """Directory where user profile data is stored."""
@@ -21,26 +30,29 @@ GLOBAL_CONFIG_PATH: str = os.path.join(CONFIG_DIR, "config.json")
 """Path to the global config file."""
 
 # Default configuration values for new profiles
-DEFAULT_CONFIG: Dict[str, Any] = {
-    "SHOW_QWERTY": True,
-    "SHOW_FINGERS": True,
-    "HARD_MODE": True,
-    "SHOW_STATS_ON_END": True,
-    "DRILL_DURATION": 300,
-    "SHUFFLE_AFTER": 5,
-    "SENTENCE_SOURCE": "local",
-    "CODE_SOURCE": "local",
-    "SENTENCES_FILE": "sentences.txt",
-    "CODE_FILE": "snippets.py",
-    "CODE_COMMAND": "",
-    "QUOTE_API_URL": "",
-    "AI_ENDPOINT": "http://localhost:8000",
-    "AI_API_TYPE": "ollama",  # "auto", "ollama", "openai"
-    "AI_MODEL": "ollama-7b",
-    "AI_API_KEY": "",
-    "PRACTICE_MODE": "curriculum",
-    "CODE_LANGUAGES": "python,rust,c,cpp",
-}
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "SHOW_QWERTY": True,
+        "SHOW_FINGERS": True,
+        "HARD_MODE": True,
+        "SHOW_STATS_ON_END": True,
+        "DRILL_DURATION": 300,
+        "SHUFFLE_AFTER": 5,
+        "SENTENCE_SOURCE": "local",
+        "CODE_SOURCE": "local",
+        "SENTENCES_FILE": "sentences.txt",
+        "CODE_FILE": "snippets.py",
+        "CODE_COMMAND": "",
+        "QUOTE_API_URL": "",
+        "AI_ENDPOINT": "http://localhost:8000",
+        "AI_API_TYPE": "ollama",  # "auto", "ollama", "openai"
+        "AI_MODEL": "ollama-7b",
+        "AI_API_KEY": "",
+        "PRACTICE_MODE": "curriculum",
+        "CODE_LANGUAGES": "python,rust,c,cpp",
+    }
+)
+"""Read-only built-in configuration defaults."""
 
 # Initial overrides for new user profiles (different from defaults for better UX)
 INITIAL_PROFILE_OVERRIDES: Dict[str, Any] = {
@@ -53,23 +65,101 @@ INITIAL_PROFILE_OVERRIDES: Dict[str, Any] = {
 
 def load_global_config() -> Dict[str, Any]:
     """Load the global configuration from the user's config directory."""
-    if not os.path.exists(CONFIG_DIR):
-        os.makedirs(CONFIG_DIR, exist_ok=True)
-    if not os.path.exists(GLOBAL_CONFIG_PATH):
-        with open(GLOBAL_CONFIG_PATH, "w") as f:
-            json.dump(DEFAULT_CONFIG, f, indent=4)
-        return DEFAULT_CONFIG.copy()
+    os.makedirs(CONFIG_DIR, exist_ok=True)
     try:
         with open(GLOBAL_CONFIG_PATH, "r") as f:
             return json.load(f)
+    except FileNotFoundError:
+        pass
     except (json.JSONDecodeError, OSError):
         return {}
+    with open(GLOBAL_CONFIG_PATH, "w") as f:
+        json.dump(dict(DEFAULT_CONFIG), f, indent=4)
+    return dict(DEFAULT_CONFIG)
+
+
+GLOBAL_CONFIG: Mapping[str, Any] = MappingProxyType(load_global_config())
+"""Read-only global configuration, loaded once at import."""
+
+_BASE_CONFIG: Optional[Tuple[Mapping[str, Any], Dict[str, Any]]] = None
+"""GLOBAL_CONFIG paired with DEFAULT_CONFIG merged with it; rebuilt whenever
+GLOBAL_CONFIG is replaced."""
+
+
+def _base_config() -> Dict[str, Any]:
+    """Return DEFAULT_CONFIG updated with GLOBAL_CONFIG, merged once per reload."""
+    global _BASE_CONFIG
+    if _BASE_CONFIG is None or _BASE_CONFIG[0] is not GLOBAL_CONFIG:
+        _BASE_CONFIG = (GLOBAL_CONFIG, {**DEFAULT_CONFIG, **GLOBAL_CONFIG})
+    return _BASE_CONFIG[1]
+
+
+def _bump_profiles_version() -> None:
+    """Invalidate cached profile listings after a profile file changes."""
+    global _profiles_version
+    _profiles_version += 1
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize profile data to indented JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_PROFILE_CACHE: Dict[str, Tuple[int, "UserProfile"]] = {}
+"""Parsed profiles keyed by file path, paired with the file's mtime (ns)."""
+
+_profiles_version: int = 0
+"""Bumped whenever this process saves or deletes a profile."""
+
+_PROFILE_LIST_CACHE: Optional[Tuple[int, str, Optional[int], List[str]]] = None
+"""Last list_profiles() result with the version, directory and directory
+mtime (ns) it was read at."""
+
+AI_VARS = namedtuple("AI_VARS", ["type", "key", "model", "endpoint"])
+"""AI provider defaults keyed off an API-key environment variable."""
+
+AI_ENV_VARS: Tuple[AI_VARS, ...] = (
+    AI_VARS(
+        "openai",
+        "OPENAI_API_KEY",
+        "gpt-5-nano",
+        "https://api.openai.com/v1/chat/completions",
+    ),
+    AI_VARS(
+        "deepseek",
+        "DEEPSEEK_API_KEY",
+        "deepseek-chat",
+        "https://api.deepseek.com/v1/chat/completions",
+    ),
+    AI_VARS(
+        "gemini",
+        "GEMINI_API_KEY",
+        "gemini-2.5-flash-lite",
+        "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-lite:generateContent",
+    ),
+    AI_VARS("ollama", "OLLAMA_API_KEY", "ollama-7b", "http://localhost:8000"),
+)
+"""AI providers checked in priority order by UserProfile.get_ai_api_key."""
 
+_AI_KEY_CACHE: Optional[Tuple[Any, ...]] = None
+"""Result of the AI environment lookup; None until first computed."""
 
-GLOBAL_CONFIG: Dict[str, Any] = load_global_config()
+_DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+"""Dataclass options giving UserProfile __slots__ where Python supports it."""
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UserProfile:
     """Represents a user profile with progress tracking and configuration.
 
@@ -91,6 +181,11 @@ class UserProfile:
     config_overrides: Dict[str, Any] = field(
         default_factory=lambda: INITIAL_PROFILE_OVERRIDES.copy()
     )
+    # Lazily built result of the `config` property, reset whenever the
+    # overrides change through set_override() or set_overrides()
+    _merged_cache: Optional[Mapping[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_config(self, key: str) -> Any:
         """Get a configuration value, falling back to defaults.
@@ -101,20 +196,26 @@ class UserProfile:
         Returns:
             Configuration value (override if exists, otherwise default)
         """
-        return self.config_overrides.get(
-            key, GLOBAL_CONFIG.get(key, DEFAULT_CONFIG[key])
-        )
+        overrides = self.config_overrides
+        if key in overrides:
+            return overrides[key]
+        return GLOBAL_CONFIG.get(key, DEFAULT_CONFIG[key])
 
     @property
-    def config(self) -> Dict[str, Any]:
-        """Get the merged configuration dictionary (overrides + defaults).
+    def config(self) -> Mapping[str, Any]:
+        """Get the merged configuration mapping (overrides + defaults).
+
+        The merged mapping is built once and reused until the overrides
+        change through set_override() or set_overrides(). It is read-only;
+        use those methods to change a setting.
 
         Returns:
-            Complete configuration dictionary with defaults and overrides merged
+            Read-only configuration mapping with defaults and overrides merged
         """
-        merged = DEFAULT_CONFIG.copy()
-        merged.update(GLOBAL_CONFIG)
-        merged.update(self.config_overrides)
+        if self._merged_cache is not None:
+            return self._merged_cache
+
+        merged = {**_base_config(), **self.config_overrides}
         if not merged.get("AI_API_KEY"):
             try:
                 api_type, api_key, model, endpoint = self.get_ai_api_key()
@@ -124,62 +225,96 @@ class UserProfile:
                 merged["AI_ENDPOINT"] = endpoint
             except Exception:
                 pass
-        return merged
+        self._merged_cache = MappingProxyType(merged)
+        return self._merged_cache
+
+    def set_override(self, key: str, value: Any) -> None:
+        """Set a single profile-specific configuration override.
+
+        Args:
+            key: Configuration key to override
+            value: Value to store for the key
+        """
+        self.config_overrides[key] = value
+        self._merged_cache = None
+
+    def set_overrides(self, overrides: Dict[str, Any]) -> None:
+        """Replace all profile-specific configuration overrides.
+
+        Args:
+            overrides: New overrides dictionary
+        """
+        self.config_overrides = overrides
+        self._merged_cache = None
 
     def get_ai_api_key(self) -> Tuple[Any, ...]:
         """Retrieves the API key for a specified AI service from the environment variables.
+
+        The lookup runs once per process; environment variables are not
+        expected to change while the app is running.
+
         Returns:
             Tuple[str, str, str, str, str]: Tuple containing the API type, api key, model name, and endpoint
         """
-        AI_VARS = namedtuple("AI_VARS", ["type", "key", "model", "endpoint"])
-
-        AI_ENV_VARS: Tuple[AI_VARS, ...] = (
-            AI_VARS(
-                "openai",
-                "OPENAI_API_KEY",
-                "gpt-5-nano",
-                "https://api.openai.com/v1/chat/completions",
-            ),
-            AI_VARS(
-                "deepseek",
-                "DEEPSEEK_API_KEY",
-                "deepseek-chat",
-                "https://api.deepseek.com/v1/chat/completions",
-            ),
-            AI_VARS(
-                "gemini",
-                "GEMINI_API_KEY",
-                "gemini-2.5-flash-lite",
-                "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-lite:generateContent",
-            ),
-            AI_VARS("ollama", "OLLAMA_API_KEY", "ollama-7b", "http://localhost:8000"),
-        )
-
-        for var in AI_ENV_VARS:
-            if os.environ.get(var.key):
-                return (var.type, os.environ[var.key], var.model, var.endpoint)
-        return ()
+        global _AI_KEY_CACHE
+        if _AI_KEY_CACHE is None:
+            _AI_KEY_CACHE = ()
+            for var in AI_ENV_VARS:
+                value = os.environ.get(var.key)
+                if value:
+                    _AI_KEY_CACHE = (var.type, value, var.model, var.endpoint)
+                    break
+        return _AI_KEY_CACHE
 
     def save(self) -> None:
         """Save the user profile to disk.
 
-        Creates the profiles directory if it doesn't exist and writes
-        the profile data as JSON.
+        Creates the profiles directory if it doesn't exist and atomically
+        replaces the profile file with the data serialized as JSON.
 
         Example:
             >>> profile = UserProfile(name="test_user")
             >>> profile.save()  # Saves to ~/.local/share/textype/test_user.json
         """
-        if not os.path.exists(PROFILES_DIR):
-            os.makedirs(PROFILES_DIR)
+        os.makedirs(PROFILES_DIR, exist_ok=True)
         path = os.path.join(PROFILES_DIR, f"{self.name.lower().replace(' ', '_')}.json")
-        with open(path, "w") as f:
-            json.dump(asdict(self), f, indent=4)
+        # All persisted fields are JSON primitives, so skip asdict()'s deep copy
+        data = _dumps(
+            {
+                "name": self.name,
+                "current_lesson_index": self.current_lesson_index,
+                "wpm_record": self.wpm_record,
+                "total_drills": self.total_drills,
+                "level": self.level,
+                "config_overrides": self.config_overrides,
+            }
+        )
+        # Write to a sibling file and rename it into place, so an interrupted
+        # save never leaves a truncated profile behind
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        _PROFILE_CACHE[path] = (os.stat(path).st_mtime_ns, self._copy())
+        _bump_profiles_version()
+
+    def _copy(self) -> "UserProfile":
+        """Return a copy that does not share the mutable overrides dict."""
+        return replace(self, config_overrides=dict(self.config_overrides))
 
     @classmethod
     def load(cls, name: str) -> Optional["UserProfile"]:
         """Load a user profile from disk.
 
+        Parsed profiles are cached and reused until the file's mtime changes.
+
         Args:
             name: Name of the profile to load
 
@@ -192,16 +327,30 @@ class UserProfile:
             test_user
         """
         path = os.path.join(PROFILES_DIR, f"{name.lower()}.json")
-        if os.path.exists(path):
-            with open(path, "r") as f:
-                data = json.load(f)
-                return cls(**data)
-        return None
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            _PROFILE_CACHE.pop(path, None)
+            return None
+
+        cached = _PROFILE_CACHE.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]._copy()
+
+        with open(path, "rb") as f:
+            profile = cls(**_loads(f.read()))
+        _PROFILE_CACHE[path] = (mtime, profile._copy())
+        return profile
 
     @classmethod
-    def list_profiles(cls) -> List[str]:
+    def list_profiles(cls, cached: bool = False) -> List[str]:
         """List all available user profiles.
 
+        Args:
+            cached: Reuse the previous scan while the profiles directory's
+                mtime is unchanged and this process has not saved or deleted
+                a profile since.
+
         Returns:
             List of profile names (without .json extension)
 
@@ -210,13 +359,31 @@ class UserProfile:
             >>> print(profiles)
             ['alice', 'bob', 'charlie']
         """
-        if not os.path.exists(PROFILES_DIR):
-            return []
-        return [
-            f.replace(".json", "").replace("_", " ")
-            for f in os.listdir(PROFILES_DIR)
-            if f.endswith(".json")
-        ]
+        global _PROFILE_LIST_CACHE
+        try:
+            mtime: Optional[int] = os.stat(PROFILES_DIR).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        key = (_profiles_version, PROFILES_DIR, mtime)
+        if (
+            cached
+            and _PROFILE_LIST_CACHE is not None
+            and _PROFILE_LIST_CACHE[:3] == key
+        ):
+            return list(_PROFILE_LIST_CACHE[3])
+
+        try:
+            with os.scandir(PROFILES_DIR) as entries:
+                names = [
+                    entry.name[:-5].replace("_", " ")
+                    for entry in entries
+                    if entry.name.endswith(".json")
+                    and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            names = []
+        _PROFILE_LIST_CACHE = (*key, names)
+        return list(names)
 
     @classmethod
     def delete(cls, name: str) -> bool:
@@ -233,8 +400,10 @@ class UserProfile:
             True
         """
         path = os.path.join(PROFILES_DIR, f"{name.lower()}.json")
+        _PROFILE_CACHE.pop(path, None)
         if os.path.exists(path):
             os.remove(path)
+            _bump_profiles_version()
             return True
         return False
 
@@ -246,11 +415,11 @@ class UserProfile:
         """
         try:
             from textype.curriculum import LESSONS
-
-            if self.current_lesson_index < len(LESSONS):
-                return LESSONS[self.current_lesson_index]["name"]
-        except (ImportError, IndexError):
-            pass
+        except ImportError:
+            return "Unknown"
+        # list length is O(1), so a bounds check beats catching IndexError
+        if 0 <= self.current_lesson_index < len(LESSONS):
+            return LESSONS[self.current_lesson_index]["name"]
         return "Unknown"
 
 
@@ -280,8 +449,3 @@ Keys correspond to finger identifiers:
 - R1-R4: Right hand fingers (index to pinky)
 - THUMB: Space bar thumb
 """
-
-MAX_FINGER_HEIGHT: int = max(
-    dimensions.height for dimensions in FINGER_HEIGHTS.values()
-)
-"""Maximum height among all finger columns for alignment purposes."""
@@ -1,11 +1,11 @@
+import os
 import subprocess
 import asyncio
 import random
-import requests
 
 from pathlib import Path
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from textype.text_normalizer import normalize_text
 from textype.curriculum import SENTENCES
 import textype.config as config
@@ -17,6 +17,58 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+_SESSION: Optional["requests.Session"] = None
+"""Shared HTTP session so API/AI requests reuse pooled connections."""
+
+
+def _session() -> "requests.Session":
+    """Return the shared requests session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+    return _SESSION
+
+
+_CONFIG_KEYS = (
+    "SENTENCE_SOURCE",
+    "QUOTE_API_URL",
+    "CODE_COMMAND",
+    "AI_ENDPOINT",
+    "AI_API_TYPE",
+    "AI_MODEL",
+    "AI_API_KEY",
+    "SENTENCES_FILE",
+)
+"""Config settings read by generate_sentence."""
+
+_SENTENCE_COUNT = len(SENTENCES)
+"""Number of built-in fallback sentences."""
+
+_BLOCKING_SOURCES = frozenset({"api", "ai", "cmd", "file"})
+"""Sentence sources that perform network, subprocess or file I/O."""
+
+_SENTENCE_FILE_CACHE: Dict[str, Tuple[float, int, List[str]]] = {}
+"""Non-empty lines of sentence files keyed by path, with the (mtime, size) they were read at."""
+
+
+def _load_sentence_file(path: str) -> List[str]:
+    """Return the non-empty, stripped lines of a sentence file.
+
+    The parsed lines are cached and reused until the file's mtime or size
+    changes.
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read.
+    """
+    st = os.stat(path)
+    cached = _SENTENCE_FILE_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        return cached[2]
+    text = Path(path).read_text(encoding="utf-8", errors="ignore")
+    lines = [line.strip() for line in text.splitlines() if line and not line.isspace()]
+    _SENTENCE_FILE_CACHE[path] = (st.st_mtime, st.st_size, lines)
+    return lines
+
 
 def generate_sentence(config_overrides: Optional[Dict[str, Any]] = None) -> str:
     """Generate a random practice sentence.
@@ -25,18 +77,17 @@ def generate_sentence(config_overrides: Optional[Dict[str, Any]] = None) -> str:
     This is used for sentence practice mode.
     """
 
-    # Helper to get config value
-    def get(key):
-        if config_overrides and key in config_overrides:
-            return config_overrides[key]
-        return getattr(config, key)
+    # Module defaults merged with the overrides, resolved once per call
+    cfg = {key: getattr(config, key) for key in _CONFIG_KEYS}
+    if config_overrides:
+        cfg.update(config_overrides)
 
-    source = get("SENTENCE_SOURCE")
+    source = cfg["SENTENCE_SOURCE"]
 
     # 1. External API (Online)
     if source == "api" and HAS_REQUESTS:
         try:
-            response = requests.get(get("QUOTE_API_URL"), timeout=2)
+            response = _session().get(cfg["QUOTE_API_URL"], timeout=2)
             if response.status_code == 200:
                 # Adjust parsing based on specific API schema
                 data = response.json()
@@ -48,19 +99,19 @@ def generate_sentence(config_overrides: Optional[Dict[str, Any]] = None) -> str:
         except Exception:
             pass
 
-    if source == "cmd" and get("CODE_COMMAND"):
+    if source == "cmd" and cfg["CODE_COMMAND"]:
         try:
-            result = subprocess.check_output(get("CODE_COMMAND"), shell=True, timeout=2)
+            result = subprocess.check_output(cfg["CODE_COMMAND"], shell=True, timeout=2)
             return normalize_text(result.decode().strip())
         except Exception:
             pass
 
     if source == "ai" and HAS_REQUESTS:
         try:
-            endpoint = get("AI_ENDPOINT")
-            api_type = get("AI_API_TYPE")
-            model = get("AI_MODEL")
-            api_key = get("AI_API_KEY")
+            endpoint = cfg["AI_ENDPOINT"]
+            api_type = cfg["AI_API_TYPE"]
+            model = cfg["AI_MODEL"]
+            api_key = cfg["AI_API_KEY"]
 
             # Auto-detect API type if set to "auto"
             if api_type == "auto":
@@ -95,7 +146,7 @@ def generate_sentence(config_overrides: Optional[Dict[str, Any]] = None) -> str:
                     "stream": False,
                 }
 
-            response = requests.post(
+            response = _session().post(
                 endpoint, json=payload, headers=headers, timeout=10
             )
             if response.status_code == 200:
@@ -112,14 +163,15 @@ def generate_sentence(config_overrides: Optional[Dict[str, Any]] = None) -> str:
         except Exception:
             pass
 
-    if source == "file" or (source == "api" and get("SENTENCES_FILE")):
-        if Path(get("SENTENCES_FILE")).exists():
-            with open(get("SENTENCES_FILE"), "r") as f:
-                lines = [line.strip() for line in f if line.strip()]
-                if lines:
-                    return normalize_text(random.choice(lines))
+    if source == "file" or (source == "api" and cfg["SENTENCES_FILE"]):
+        try:
+            lines = _load_sentence_file(cfg["SENTENCES_FILE"])
+        except OSError:
+            lines = []
+        if lines:
+            return normalize_text(random.choice(lines))
 
-    return normalize_text(random.choice(SENTENCES))
+    return normalize_text(SENTENCES[random.randrange(_SENTENCE_COUNT)])
 
 
 async def generate_sentence_async(
@@ -130,6 +182,11 @@ async def generate_sentence_async(
     Returns a random sentence from the configured sentence list.
     This is used for sentence practice mode with async pre-fetching.
     """
+    source = (config_overrides or {}).get("SENTENCE_SOURCE", config.SENTENCE_SOURCE)
+    if source not in _BLOCKING_SOURCES:
+        # The built-in list never blocks, so skip the worker thread
+        return generate_sentence(config_overrides)
+
     # Run the synchronous function in a thread to avoid blocking
     return await asyncio.to_thread(generate_sentence, config_overrides)
 
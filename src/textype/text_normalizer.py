@@ -5,14 +5,200 @@ ASCII equivalents, replacing fancy quotes, dashes, ellipsis, and other
 special characters with standard keyboard characters.
 """
 
-import unicodedata
+import sys
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
+_REPLACEMENTS: Dict[str, str] = {
+    # Smart quotes and apostrophes
+    "\u2018": "'",  # Left single quotation mark
+    "\u2019": "'",  # Right single quotation mark
+    "\u201a": "'",  # Single low-9 quotation mark
+    "\u201b": "'",  # Single high-reversed-9 quotation mark
+    "\u201c": '"',  # Left double quotation mark
+    "\u201d": '"',  # Right double quotation mark
+    "\u201e": '"',  # Double low-9 quotation mark
+    "\u201f": '"',  # Double high-reversed-9 quotation mark
+    "\u2032": "'",  # Prime
+    "\u2033": '"',  # Double prime
+    "\u2034": "'''",  # Triple prime
+    "\u2035": "'",  # Reversed prime
+    "\u2036": '"',  # Reversed double prime
+    "\u2037": "'''",  # Reversed triple prime
+    # Dashes and hyphens
+    "\u2010": "-",  # Hyphen
+    "\u2011": "-",  # Non-breaking hyphen
+    "\u2012": "-",  # Figure dash
+    "\u2013": "-",  # En dash
+    "\u2014": "--",  # Em dash (common replacement)
+    "\u2015": "--",  # Horizontal bar
+    "\u2053": "~",  # Swung dash
+    # Ellipsis
+    "\u2026": "...",  # Horizontal ellipsis
+    # Spaces
+    "\u00a0": " ",  # Non-breaking space
+    "\u2000": " ",  # En quad
+    "\u2001": " ",  # Em quad
+    "\u2002": " ",  # En space
+    "\u2003": " ",  # Em space
+    "\u2004": " ",  # Three-per-em space
+    "\u2005": " ",  # Four-per-em space
+    "\u2006": " ",  # Six-per-em space
+    "\u2007": " ",  # Figure space
+    "\u2008": " ",  # Punctuation space
+    "\u2009": " ",  # Thin space
+    "\u200a": " ",  # Hair space
+    "\u200b": "",  # Zero width space (remove)
+    "\u200c": "",  # Zero width non-joiner (remove)
+    "\u200d": "",  # Zero width joiner (remove)
+    "\u202f": " ",  # Narrow no-break space
+    # Mathematical symbols (common in text)
+    "\u00d7": "x",  # Multiplication sign
+    "\u00f7": "/",  # Division sign
+    "\u00b1": "+/-",  # Plus-minus sign
+    "\u2260": "!=",  # Not equal to
+    "\u2264": "<=",  # Less-than or equal to
+    "\u2265": ">=",  # Greater-than or equal to
+    "\u2212": "-",  # Minus sign
+    "\u2217": "*",  # Asterisk operator
+    # Currency symbols (replace with abbreviations)
+    "\u00a2": "cents",  # Cent sign
+    "\u00a3": "GBP",  # Pound sign
+    "\u00a4": "USD",  # Currency sign
+    "\u00a5": "JPY",  # Yen sign
+    "\u20ac": "EUR",  # Euro sign
+    # Copyright and trademark symbols
+    "\u00a9": "(c)",  # Copyright sign
+    "\u00ae": "(r)",  # Registered sign
+    "\u2122": "TM",  # Trade mark sign
+    # Letter-like symbols
+    "\u2117": "(p)",  # Sound recording copyright
+    "\u2120": "SM",  # Service mark
+    # Fractions (replace with ASCII equivalents)
+    "\u00bc": "1/4",  # Vulgar fraction one quarter
+    "\u00bd": "1/2",  # Vulgar fraction one half
+    "\u00be": "3/4",  # Vulgar fraction three quarters
+    "\u2044": "/",  # Fraction slash
+    # Degree and other symbols
+    "\u00b0": "deg",  # Degree sign
+    "\u00b5": "u",  # Micro sign (mu)
+    # Punctuation (rare but possible)
+    "\u2022": "*",  # Bullet
+    "\u2023": ">",  # Triangular bullet
+    "\u2043": "-",  # Hyphen bullet
+    "\u204e": "*",  # Low asterisk
+    "\u204f": ";",  # Reversed semicolon
+    "\u2051": "**",  # Two asterisks aligned vertically
+    "\u2052": "%",  # Commercial minus sign
+    "\u2056": "...",  # Three dot punctuation
+    "\u2058": "....",  # Four dot punctuation
+    "\u2059": ".....",  # Five dot punctuation
+    # Arrows (replace with text)
+    "\u2190": "<-",  # Leftwards arrow
+    "\u2191": "^",  # Upwards arrow
+    "\u2192": "->",  # Rightwards arrow
+    "\u2193": "v",  # Downwards arrow
+    "\u2194": "<->",  # Left right arrow
+    "\u2195": "^v",  # Up down arrow
+    # Other symbols
+    "\u00ab": "<<",  # Left-pointing double angle quotation mark
+    "\u00bb": ">>",  # Right-pointing double angle quotation mark
+    "\u00a1": "!",  # Inverted exclamation mark
+    "\u00bf": "?",  # Inverted question mark
+    "\u00b7": "*",  # Middle dot
+    "\u00b6": "P",  # Pilcrow sign
+    "\u00a7": "S",  # Section sign
+    "\u2126": "Ohm",  # Ohm sign
+    "\u212b": "A",  # Angstrom sign
+}
+"""Specific Unicode characters mapped to keyboard-typable replacements."""
 
+_TRANS_TABLE: Dict[int, str] = str.maketrans(_REPLACEMENTS)
+"""Translation table for _REPLACEMENTS, built once at import."""
+
+_BMP_TABLE: Optional[Dict[int, str]] = None
+"""_TRANS_TABLE merged with the stripped NFKD form of every other BMP character."""
+
+_LATIN1_TABLES: Optional[Tuple[bytes, Tuple[Tuple[bytes, bytes], ...]]] = None
+"""Byte-level form of _BMP_TABLE for Latin-1 text: a bytes.translate table for
+one-to-one mappings plus (byte, replacement) pairs for multi-byte expansions."""
+
+_COMBINING_DELETE: Optional[Dict[int, None]] = None
+"""str.translate table deleting every combining mark, built on first astral input."""
+
+
+def _bmp_table() -> Dict[int, str]:
+    """Return a translation table that fully normalizes BMP characters.
+
+    NFKD decomposes each character independently and canonical reordering
+    only moves combining marks, which are stripped anyway, so normalizing
+    per character gives the same result as normalizing the whole string.
+    Explicit replacements take precedence over decompositions.
+
+    One-to-many entries stay in the same table: a one-to-one translate
+    followed by str.replace for the expansions measured slower on
+    CPython 3.11-3.13, whose translate handles mixed tables fine.
+    """
+    global _BMP_TABLE
+    if _BMP_TABLE is None:
+        # Imported here so ASCII-only sessions never load the Unicode database
+        import unicodedata
+
+        # Local bindings avoid an attribute lookup per codepoint
+        combining = unicodedata.combining
+        normalize = unicodedata.normalize
+        table: Dict[int, str] = {}
+        for cp in range(0x80, 0x10000):
+            char = chr(cp)
+            decomposed = normalize("NFKD", char)
+            if decomposed != char or combining(char):
+                table[cp] = "".join([c for c in decomposed if not combining(c)])
+        table.update(_TRANS_TABLE)
+        _BMP_TABLE = table
+    return _BMP_TABLE
+
+
+def _latin1_tables() -> Tuple[bytes, Tuple[Tuple[bytes, bytes], ...]]:
+    """Return the byte translation table and expansions for Latin-1 text."""
+    global _LATIN1_TABLES
+    if _LATIN1_TABLES is None:
+        table = _bmp_table()
+        single = bytearray(range(256))
+        multi = []
+        for cp in range(0x80, 0x100):
+            result = table.get(cp, chr(cp))
+            if len(result) == 1 and result <= "\xff":
+                single[cp] = ord(result)
+            else:
+                multi.append((bytes((cp,)), result.encode("latin-1")))
+        _LATIN1_TABLES = (bytes(single), tuple(multi))
+    return _LATIN1_TABLES
+
+
+def _combining_delete() -> Dict[int, None]:
+    """Return a translation table that deletes every combining mark.
+
+    The table is derived from unicodedata rather than hard-coded block
+    ranges, so it strips exactly what unicodedata.combining() flags.
+    """
+    global _COMBINING_DELETE
+    if _COMBINING_DELETE is None:
+        import unicodedata
+
+        combining = unicodedata.combining
+        _COMBINING_DELETE = {
+            cp: None for cp in range(sys.maxunicode + 1) if combining(chr(cp))
+        }
+    return _COMBINING_DELETE
+
+
+@lru_cache(maxsize=256)
 def normalize_text(text: str) -> str:
     """Normalize Unicode text to keyboard-typable ASCII equivalents.
 
     Replaces fancy quotes, dashes, ellipsis, and other special Unicode
-    characters with their standard keyboard-typable equivalents.
+    characters with their standard keyboard-typable equivalents. Results
+    for recently seen texts are cached.
 
     Args:
         text: Input string possibly containing Unicode characters
@@ -20,115 +206,35 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized string with Unicode characters replaced by ASCII equivalents
     """
+    # Every replacement key is non-ASCII and NFKD leaves ASCII untouched
+    if text.isascii():
+        return text
+
+    highest = max(text)
+
+    # Latin-1 text is translated as one byte per character
+    if highest <= "\xff":
+        single, multi = _latin1_tables()
+        data = text.encode("latin-1").translate(single)
+        for char, replacement in multi:
+            if char in data:
+                data = data.replace(char, replacement)
+        return data.decode("latin-1")
+
+    # Without astral characters, a single translate covers all the steps below
+    if highest <= "\uffff":
+        return text.translate(_bmp_table())
+
     # Step 1: Replace specific Unicode characters with keyboard-typable equivalents
-    replacements = {
-        # Smart quotes and apostrophes
-        "\u2018": "'",  # Left single quotation mark
-        "\u2019": "'",  # Right single quotation mark
-        "\u201a": "'",  # Single low-9 quotation mark
-        "\u201b": "'",  # Single high-reversed-9 quotation mark
-        "\u201c": '"',  # Left double quotation mark
-        "\u201d": '"',  # Right double quotation mark
-        "\u201e": '"',  # Double low-9 quotation mark
-        "\u201f": '"',  # Double high-reversed-9 quotation mark
-        "\u2032": "'",  # Prime
-        "\u2033": '"',  # Double prime
-        "\u2034": "'''",  # Triple prime
-        "\u2035": "'",  # Reversed prime
-        "\u2036": '"',  # Reversed double prime
-        "\u2037": "'''",  # Reversed triple prime
-        # Dashes and hyphens
-        "\u2010": "-",  # Hyphen
-        "\u2011": "-",  # Non-breaking hyphen
-        "\u2012": "-",  # Figure dash
-        "\u2013": "-",  # En dash
-        "\u2014": "--",  # Em dash (common replacement)
-        "\u2015": "--",  # Horizontal bar
-        "\u2053": "~",  # Swung dash
-        # Ellipsis
-        "\u2026": "...",  # Horizontal ellipsis
-        # Spaces
-        "\u00a0": " ",  # Non-breaking space
-        "\u2000": " ",  # En quad
-        "\u2001": " ",  # Em quad
-        "\u2002": " ",  # En space
-        "\u2003": " ",  # Em space
-        "\u2004": " ",  # Three-per-em space
-        "\u2005": " ",  # Four-per-em space
-        "\u2006": " ",  # Six-per-em space
-        "\u2007": " ",  # Figure space
-        "\u2008": " ",  # Punctuation space
-        "\u2009": " ",  # Thin space
-        "\u200a": " ",  # Hair space
-        "\u200b": "",  # Zero width space (remove)
-        "\u200c": "",  # Zero width non-joiner (remove)
-        "\u200d": "",  # Zero width joiner (remove)
-        "\u202f": " ",  # Narrow no-break space
-        # Mathematical symbols (common in text)
-        "\u00d7": "x",  # Multiplication sign
-        "\u00f7": "/",  # Division sign
-        "\u00b1": "+/-",  # Plus-minus sign
-        "\u2260": "!=",  # Not equal to
-        "\u2264": "<=",  # Less-than or equal to
-        "\u2265": ">=",  # Greater-than or equal to
-        "\u2212": "-",  # Minus sign
-        "\u2217": "*",  # Asterisk operator
-        # Currency symbols (replace with abbreviations)
-        "\u00a2": "cents",  # Cent sign
-        "\u00a3": "GBP",  # Pound sign
-        "\u00a4": "USD",  # Currency sign
-        "\u00a5": "JPY",  # Yen sign
-        "\u20ac": "EUR",  # Euro sign
-        # Copyright and trademark symbols
-        "\u00a9": "(c)",  # Copyright sign
-        "\u00ae": "(r)",  # Registered sign
-        "\u2122": "TM",  # Trade mark sign
-        # Letter-like symbols
-        "\u2117": "(p)",  # Sound recording copyright
-        "\u2120": "SM",  # Service mark
-        # Fractions (replace with ASCII equivalents)
-        "\u00bc": "1/4",  # Vulgar fraction one quarter
-        "\u00bd": "1/2",  # Vulgar fraction one half
-        "\u00be": "3/4",  # Vulgar fraction three quarters
-        "\u2044": "/",  # Fraction slash
-        # Degree and other symbols
-        "\u00b0": "deg",  # Degree sign
-        "\u00b5": "u",  # Micro sign (mu)
-        # Punctuation (rare but possible)
-        "\u2022": "*",  # Bullet
-        "\u2023": ">",  # Triangular bullet
-        "\u2043": "-",  # Hyphen bullet
-        "\u204e": "*",  # Low asterisk
-        "\u204f": ";",  # Reversed semicolon
-        "\u2051": "**",  # Two asterisks aligned vertically
-        "\u2052": "%",  # Commercial minus sign
-        "\u2056": "...",  # Three dot punctuation
-        "\u2058": "....",  # Four dot punctuation
-        "\u2059": ".....",  # Five dot punctuation
-        # Arrows (replace with text)
-        "\u2190": "<-",  # Leftwards arrow
-        "\u2191": "^",  # Upwards arrow
-        "\u2192": "->",  # Rightwards arrow
-        "\u2193": "v",  # Downwards arrow
-        "\u2194": "<->",  # Left right arrow
-        "\u2195": "^v",  # Up down arrow
-        # Other symbols
-        "\u00ab": "<<",  # Left-pointing double angle quotation mark
-        "\u00bb": ">>",  # Right-pointing double angle quotation mark
-        "\u00a1": "!",  # Inverted exclamation mark
-        "\u00bf": "?",  # Inverted question mark
-        "\u00b7": "*",  # Middle dot
-        "\u00b6": "P",  # Pilcrow sign
-        "\u00a7": "S",  # Section sign
-        "\u2126": "Ohm",  # Ohm sign
-        "\u212b": "A",  # Angstrom sign
-    }
-
-    trans_table = str.maketrans(replacements)
-
-    translated = text.translate(trans_table)
-
-    decomposed = unicodedata.normalize("NFKD", translated)
-    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    translated = text.translate(_TRANS_TABLE)
+
+    import unicodedata
+
+    # Quick Check answers YES for most drill text, sparing the normalize call
+    if unicodedata.is_normalized("NFKD", translated):
+        decomposed = translated
+    else:
+        decomposed = unicodedata.normalize("NFKD", translated)
+    stripped = decomposed.translate(_combining_delete())
 
     return stripped
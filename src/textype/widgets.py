@@ -4,11 +4,13 @@ This module defines custom widgets and modal screens used in the
 Textype application, including finger visualization, statistics display,
 and profile selection.
 """
-from typing import Optional, Dict, Any, Tuple
+import asyncio
+from typing import Optional, Dict, Any, FrozenSet, Iterable, List, Mapping, Tuple
+from rich.segment import Segment
+from rich.style import Style
 from textual.app import ComposeResult
 from textual.widgets import Static, Label, Button, Input, ListItem, ListView, Select
 from textual.containers import (
-    Container,
     Center,
     Middle,
     Horizontal,
@@ -16,57 +18,196 @@ from textual.containers import (
 )
 from textual.screen import Screen
 from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.strip import Strip
+from textual.widget import Widget
 
 
-from textype.models import UserProfile, MAX_FINGER_HEIGHT, DEFAULT_CONFIG
+from textype.models import (
+    UserProfile,
+    FINGER_HEIGHTS,
+    DEFAULT_CONFIG,
+)
+
+_BOOL_OPTIONS: Tuple[Tuple[str, str], ...] = (("True", "True"), ("False", "False"))
+"""Select options for boolean configuration values."""
+
+_BOOL_MAP: Dict[str, bool] = {
+    "true": True,
+    "yes": True,
+    "1": True,
+    "on": True,
+    "false": False,
+    "no": False,
+    "0": False,
+    "off": False,
+}
+"""Lowercased boolean spellings accepted in configuration values."""
+
+_SELECT_CHOICES: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "PRACTICE_MODE": (("curriculum", "sentences", "code"), "curriculum"),
+    "SENTENCE_SOURCE": (("local", "file", "api", "cmd", "ai"), "api"),
+    "CODE_SOURCE": (("local", "file", "cmd", "ai"), "local"),
+    "AI_API_TYPE": (("auto", "ollama", "openai"), "auto"),
+}
+"""Valid values and fallback value for each select-style configuration key."""
+
+_SELECT_OPTIONS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    key: tuple((value, value) for value in values)
+    for key, (values, _) in _SELECT_CHOICES.items()
+}
+"""Select options for each key in _SELECT_CHOICES, built once at import."""
+
+_CONFIG_ROWS: Tuple[Tuple[str, str, str], ...] = (
+    ("UI Configuration", "SHOW_QWERTY", "Show Keyboard"),
+    ("UI Configuration", "SHOW_FINGERS", "Show Finger Guide"),
+    ("UI Configuration", "SHOW_STATS_ON_END", "Show Stats Automatically"),
+    ("UI Configuration", "HARD_MODE", "Hard Mode (errors prevent progress)"),
+    ("Practice Settings", "DRILL_DURATION", "Drill Duration (seconds)"),
+    ("Practice Settings", "SHUFFLE_AFTER", "Shuffle After (repetitions)"),
+    ("Practice Settings", "PRACTICE_MODE", "Practice Mode"),
+    ("Practice Settings", "CODE_LANGUAGES", "Code Languages (comma-separated)"),
+    ("Sentence Generation", "SENTENCE_SOURCE", "Sentence Source"),
+    ("Sentence Generation", "SENTENCES_FILE", "Sentences File Path"),
+    ("Sentence Generation", "QUOTE_API_URL", "Quote API URL"),
+    ("Sentence Generation", "CODE_COMMAND", "Command for Sentence Generation"),
+    ("Sentence Generation", "AI_ENDPOINT", "AI Endpoint URL"),
+    ("Sentence Generation", "AI_API_TYPE", "AI API Type"),
+    ("Sentence Generation", "AI_MODEL", "AI Model Name"),
+    ("Sentence Generation", "AI_API_KEY", "AI API Key (optional)"),
+    ("Code Generation", "CODE_SOURCE", "Code Source"),
+    ("Code Generation", "CODE_FILE", "Code Snippets File Path"),
+)
+"""(section, key, label) for each editable setting, in display order."""
 
 
-class FingerColumn(Container):
-    """A visual representation of a single finger's column.
+class FingerRow(Widget):
+    """The finger guide, drawn as a single widget.
 
-    Displays a vertical column representing a finger with adjustable
-    height and width for the finger guide visualization.
+    Each finger is a bottom-aligned block with a top edge and a centred
+    label, laid out left to right with a one-cell gap on either side.
+    Drawing every finger in one widget keeps the row to a single
+    compositor region, and highlight changes only repaint the fingers
+    whose state changed.
 
     Attributes:
-        fid: Finger identifier (e.g., "L1", "R2", "THUMB")
-        height: Vertical height of the finger column
-        width: Horizontal width of the finger column
+        fingers: Finger identifier mapped to (height, width), in display order
+        active: Identifiers of the currently highlighted fingers
     """
 
-    def __init__(self, fid: str, height: int, width: int) -> None:
-        """Initialize a finger column.
+    COMPONENT_CLASSES = {
+        "finger-row--body",
+        "finger-row--edge",
+        "finger-row--active",
+        "finger-row--active-edge",
+        "finger-row--thumb-active",
+    }
+
+    DEFAULT_CSS = """
+    FingerRow {
+        width: auto;
+        height: auto;
+    }
+    """
+
+    def __init__(
+        self,
+        fingers: Mapping[str, Tuple[int, int]] = FINGER_HEIGHTS,
+        id: Optional[str] = None,
+    ) -> None:
+        """Initialize the finger row.
 
         Args:
-            fid: Finger identifier
-            height: Column height
-            width: Column width
+            fingers: Finger identifier mapped to (height, width), in display order
+            id: Optional widget ID
         """
-        super().__init__(classes="finger-column")
-        self.fid = fid
-        self.height = height
-        self.width = width
+        super().__init__(id=id)
+        self.fingers: Dict[str, Tuple[int, int]] = {
+            fid: (height, width) for fid, (height, width) in fingers.items()
+        }
+        self.active: FrozenSet[str] = frozenset()
+        self._row_height = max(
+            (height for height, _ in self.fingers.values()), default=0
+        )
+        # Each finger's region within the row, for partial refreshes
+        self._regions: Dict[str, Region] = {}
+        x = 0
+        for fid, (height, width) in self.fingers.items():
+            self._regions[fid] = Region(x, self._row_height - height, width + 2, height)
+            x += width + 2
+        self._row_width = x
 
-    def compose(self) -> ComposeResult:
-        """Compose the finger column widget.
+    def get_content_width(self, container: Size, viewport: Size) -> int:
+        """Return the combined width of all fingers and their gaps."""
+        return self._row_width
 
-        Creates a spacer for alignment and the finger body with
-        appropriate styling.
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        """Return the height of the tallest finger."""
+        return self._row_height
 
-        Yields:
-            Widgets for the finger column
+    def set_active(self, fids: Iterable[str]) -> None:
+        """Highlight the given fingers and clear all others.
+
+        Args:
+            fids: Identifiers of the fingers to highlight
         """
-        spacer = Static("")
-        spacer.styles.height = MAX_FINGER_HEIGHT - self.height
-        yield spacer
-
-        body = Static(
-            self.fid if self.fid != "THUMB" else "   ",
-            id=self.fid,
-            classes="finger-body",
-        )
-        body.styles.height = self.height
-        body.styles.width = self.width
-        yield body
+        active = frozenset(fids)
+        changed = active ^ self.active
+        if not changed:
+            return
+        self.active = active
+        self.refresh(*(self._regions[fid] for fid in changed if fid in self._regions))
+
+    def render_line(self, y: int) -> Strip:
+        """Render one line of the finger row.
+
+        Args:
+            y: Line number, from the top of the row
+
+        Returns:
+            The line as a strip of segments
+        """
+        blank = self.rich_style
+        segments: List[Segment] = []
+        for fid, (height, width) in self.fingers.items():
+            segments.append(Segment(" ", blank))
+            top = self._row_height - height
+            if y < top:
+                segments.append(Segment(" " * width, blank))
+            else:
+                fill = self.get_component_rich_style(
+                    "finger-row--active" if fid in self.active else "finger-row--body"
+                )
+                if fid == "THUMB" and fid in self.active:
+                    fill += self.get_component_rich_style(
+                        "finger-row--thumb-active", partial=True
+                    )
+                if y == top:
+                    edge = self.get_component_rich_style(
+                        "finger-row--active-edge"
+                        if fid in self.active
+                        else "finger-row--edge",
+                        partial=True,
+                    )
+                    segments.append(
+                        Segment(
+                            "\u2500" * width,
+                            Style(color=edge.color, bgcolor=fill.bgcolor),
+                        )
+                    )
+                elif y - top - 1 == (height - 2) // 2:
+                    label = fid if fid != "THUMB" else "   "
+                    left = (width - len(label)) // 2
+                    segments.append(
+                        Segment(
+                            " " * left + label + " " * (width - left - len(label)),
+                            fill,
+                        )
+                    )
+                else:
+                    segments.append(Segment(" " * width, fill))
+            segments.append(Segment(" ", blank))
+        return Strip(segments, self._row_width)
 
 
 class StatsScreen(Screen):
@@ -75,6 +216,9 @@ class StatsScreen(Screen):
     Shows WPM, accuracy, and error count after a drill session completes.
     """
 
+    _BUTTON_RESULTS: Dict[str, str] = {"repeat-button": "repeat"}
+    """Dismiss result per button id; any other button continues to "next"."""
+
     def __init__(
         self, wpm: int, accuracy: int, errors: int, passed: bool = True
     ) -> None:
@@ -91,6 +235,8 @@ class StatsScreen(Screen):
         self.accuracy = accuracy
         self.errors = errors
         self.passed = passed
+        # One widget for all stats; blank lines stand in for per-line margins
+        self._stats_body = f"WPM: {wpm}\n\nAccuracy: {accuracy}%\n\nErrors: {errors}"
 
     def compose(self) -> ComposeResult:
         """Compose the statistics screen.
@@ -101,9 +247,7 @@ class StatsScreen(Screen):
         with Center():
             with Middle(id="stats-modal"):
                 yield Label("DRILL COMPLETE", id="stats-title")
-                yield Label(f"WPM: {self.wpm}", classes="stat-line")
-                yield Label(f"Accuracy: {self.accuracy}%", classes="stat-line")
-                yield Label(f"Errors: {self.errors}", classes="stat-line")
+                yield Static(self._stats_body, id="stats-body", classes="stat-line")
                 with Horizontal():
                     yield Button("Repeat Lesson", variant="default", id="repeat-button")
                     if self.passed:
@@ -122,10 +266,7 @@ class StatsScreen(Screen):
         Args:
             event: Button press event
         """
-        if event.button.id == "repeat-button":
-            self.dismiss("repeat")
-        else:
-            self.dismiss("next")
+        self.dismiss(self._BUTTON_RESULTS.get(event.button.id, "next"))
 
 
 class ConfigWidgetFactory:
@@ -151,12 +292,10 @@ class ConfigWidgetFactory:
         Returns:
             Tuple of (widget, widget_id)
         """
-        expected_type = type(default_value)
-
-        if expected_type == bool:
-            return ConfigWidgetFactory._create_boolean_widget(key, effective_value)
-        elif key in ("PRACTICE_MODE", "SENTENCE_SOURCE", "CODE_SOURCE", "AI_API_TYPE"):
+        if key in _SELECT_CHOICES:
             return ConfigWidgetFactory._create_select_widget(key, effective_value)
+        elif type(default_value) is bool:
+            return ConfigWidgetFactory._create_boolean_widget(key, effective_value)
         else:
             return ConfigWidgetFactory._create_input_widget(
                 key, label, effective_value, default_value
@@ -167,17 +306,13 @@ class ConfigWidgetFactory:
         """Create a Select dropdown for boolean values."""
         if isinstance(effective_value, bool):
             str_value = "True" if effective_value else "False"
+        elif _BOOL_MAP.get(str(effective_value).strip().lower(), False):
+            str_value = "True"
         else:
-            str_value = str(effective_value).strip()
-            if str_value.lower() in ("true", "yes", "1", "on"):
-                str_value = "True"
-            elif str_value.lower() in ("false", "no", "0", "off"):
-                str_value = "False"
-            else:
-                str_value = "False"
+            str_value = "False"
 
         select_widget = Select(
-            options=[("True", "True"), ("False", "False")],
+            options=_BOOL_OPTIONS,
             value=str_value,
             id=f"input-{key}",
             classes="config-select",
@@ -187,56 +322,15 @@ class ConfigWidgetFactory:
     @staticmethod
     def _create_select_widget(key: str, effective_value: Any) -> Tuple[Select, str]:
         """Create a Select dropdown for mode/source selection."""
-        if key == "PRACTICE_MODE":
-            options = [
-                ("curriculum", "curriculum"),
-                ("sentences", "sentences"),
-                ("code", "code"),
-            ]
-            default_val = "curriculum"
-        elif key == "SENTENCE_SOURCE":
-            options = [
-                ("local", "local"),
-                ("file", "file"),
-                ("api", "api"),
-                ("cmd", "cmd"),
-                ("ai", "ai"),
-            ]
-            default_val = "api"
-        elif key == "AI_API_TYPE":
-            options = [
-                ("auto", "auto"),
-                ("ollama", "ollama"),
-                ("openai", "openai"),
-            ]
-            default_val = "auto"
-        else:  # CODE_SOURCE
-            options = [
-                ("local", "local"),
-                ("file", "file"),
-                ("cmd", "cmd"),
-                ("ai", "ai"),
-            ]
-            default_val = "local"
+        values, default_val = _SELECT_CHOICES[key]
 
+        # Blank or unknown values fall back to the key's default option
         str_value = str(effective_value).strip()
-        if not str_value or str_value == "":
+        if str_value not in values:
             str_value = default_val
 
-        # Extract valid values from options tuples
-        valid_values = [opt[0] for opt in options]
-
-        # Ensure str_value is a valid option
-        if str_value not in valid_values:
-            # Try default value
-            if default_val in valid_values:
-                str_value = default_val
-            else:
-                # Fallback to first option
-                str_value = valid_values[0] if valid_values else ""
-
         select_widget = Select(
-            options=options,
+            options=_SELECT_OPTIONS[key],
             value=str_value,
             id=f"input-{key}",
             classes="config-select",
@@ -277,6 +371,13 @@ class ConfigWidgetFactory:
 class ProfileInfoScreen(Screen):
     """Screen displaying profile information and editable configuration."""
 
+    _BUTTON_HANDLERS: Dict[str, str] = {
+        "save-button": "_save_profile",
+        "cancel-button": "_cancel_changes",
+        "delete-button": "_confirm_profile_deletion",
+    }
+    """Handler method name per button id."""
+
     def __init__(self, profile: UserProfile) -> None:
         """Initialize the profile info screen.
 
@@ -285,8 +386,9 @@ class ProfileInfoScreen(Screen):
         """
         super().__init__()
         self.profile = profile
-        self.original_config = profile.config_overrides.copy()
         self.modified_config = profile.config_overrides.copy()
+        self._config_widgets: Dict[str, Widget] = {}
+        self._last_values: Dict[str, Any] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the profile info screen.
@@ -301,78 +403,26 @@ class ProfileInfoScreen(Screen):
                 # Read-only profile information in a scrollable container
                 with ScrollableContainer(classes="profile-section"):
                     yield Label("Profile Information", classes="section-title")
-                    yield Label(
-                        f"Current Lesson: {self.profile.get_current_lesson_name()}",
-                        classes="stat-line",
-                    )
-                    yield Label(
-                        f"Current Lesson Index: {self.profile.current_lesson_index}",
-                        classes="stat-line",
-                    )
-                    yield Label(
-                        f"WPM Record: {self.profile.wpm_record}", classes="stat-line"
-                    )
-                    yield Label(
-                        f"Total Drills: {self.profile.total_drills}",
-                        classes="stat-line",
-                    )
-                    yield Label(f"Level: {self.profile.level}", classes="stat-line")
+                    profile = self.profile
+                    for line in (
+                        f"Current Lesson: {profile.get_current_lesson_name()}",
+                        f"Current Lesson Index: {profile.current_lesson_index}",
+                        f"WPM Record: {profile.wpm_record}",
+                        f"Total Drills: {profile.total_drills}",
+                        f"Level: {profile.level}",
+                    ):
+                        yield Label(line, classes="stat-line")
 
                 # Editable configuration
                 with ScrollableContainer(classes="config-section"):
                     yield Label("Configuration Settings", classes="section-title")
 
-                    # UI Configuration
-                    yield Label("UI Configuration", classes="subsection-title")
-                    yield self._create_config_widget("SHOW_QWERTY", "Show Keyboard")
-                    yield self._create_config_widget(
-                        "SHOW_FINGERS", "Show Finger Guide"
-                    )
-                    yield self._create_config_widget(
-                        "SHOW_STATS_ON_END", "Show Stats Automatically"
-                    )
-                    yield self._create_config_widget(
-                        "HARD_MODE", "Hard Mode (errors prevent progress)"
-                    )
-
-                    # Practice Settings
-                    yield Label("Practice Settings", classes="subsection-title")
-                    yield self._create_config_widget(
-                        "DRILL_DURATION", "Drill Duration (seconds)"
-                    )
-                    yield self._create_config_widget(
-                        "SHUFFLE_AFTER", "Shuffle After (repetitions)"
-                    )
-                    yield self._create_config_widget("PRACTICE_MODE", "Practice Mode")
-                    yield self._create_config_widget(
-                        "CODE_LANGUAGES", "Code Languages (comma-separated)"
-                    )
-
-                    # Sentence Generation
-                    yield Label("Sentence Generation", classes="subsection-title")
-                    yield self._create_config_widget(
-                        "SENTENCE_SOURCE", "Sentence Source"
-                    )
-                    yield self._create_config_widget(
-                        "SENTENCES_FILE", "Sentences File Path"
-                    )
-                    yield self._create_config_widget("QUOTE_API_URL", "Quote API URL")
-                    yield self._create_config_widget(
-                        "CODE_COMMAND", "Command for Sentence Generation"
-                    )
-                    yield self._create_config_widget("AI_ENDPOINT", "AI Endpoint URL")
-                    yield self._create_config_widget("AI_API_TYPE", "AI API Type")
-                    yield self._create_config_widget("AI_MODEL", "AI Model Name")
-                    yield self._create_config_widget(
-                        "AI_API_KEY", "AI API Key (optional)"
-                    )
-
-                    # Code Generation
-                    yield Label("Code Generation", classes="subsection-title")
-                    yield self._create_config_widget("CODE_SOURCE", "Code Source")
-                    yield self._create_config_widget(
-                        "CODE_FILE", "Code Snippets File Path"
-                    )
+                    current_section = None
+                    for section, key, label in _CONFIG_ROWS:
+                        if section != current_section:
+                            yield Label(section, classes="subsection-title")
+                            current_section = section
+                        yield self._create_config_widget(key, label)
 
                 # Action buttons
                 with Horizontal(classes="action-buttons"):
@@ -390,6 +440,7 @@ class ProfileInfoScreen(Screen):
         widget, widget_id = ConfigWidgetFactory.create_widget(
             key, label, effective_value, default_value, self.modified_config
         )
+        self._config_widgets[key] = widget
 
         return Horizontal(
             Label(f"{label}:", classes="config-label"), widget, classes="config-row"
@@ -397,7 +448,7 @@ class ProfileInfoScreen(Screen):
 
     def on_mount(self) -> None:
         """Focus the first config widget when screen mounts."""
-        first_widget = self.query_one(".config-input, .config-select")
+        first_widget = next(iter(self._config_widgets.values()), None)
         if first_widget:
             first_widget.focus()
 
@@ -412,7 +463,11 @@ class ProfileInfoScreen(Screen):
     def _handle_config_change(self, widget_id: str, value: str) -> None:
         """Update modified configuration when any config widget changes."""
         if widget_id and widget_id.startswith("input-"):
-            key = widget_id.replace("input-", "")
+            key = widget_id[6:]
+            # Repeated change events for the same value need no reprocessing
+            if key in self._last_values and self._last_values[key] == value:
+                return
+            self._last_values[key] = value
             default_value = DEFAULT_CONFIG.get(key)
 
             # Determine expected type from DEFAULT_CONFIG
@@ -420,14 +475,8 @@ class ProfileInfoScreen(Screen):
 
             # Convert to appropriate type and compare with default
             if expected_type == bool:
-                # Handle boolean values
-                if value.lower() in ("true", "yes", "1", "on"):
-                    converted_value = True
-                elif value.lower() in ("false", "no", "0", "off"):
-                    converted_value = False
-                else:
-                    # Invalid boolean, keep as string for now
-                    converted_value = value
+                # Handle boolean values; invalid ones are kept as-is for now
+                converted_value = _BOOL_MAP.get(str(value).strip().lower(), value)
 
                 # Compare with default (after conversion)
                 if (
@@ -467,20 +516,23 @@ class ProfileInfoScreen(Screen):
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press actions."""
-        if event.button.id == "save-button":
-            # Save changes to profile
-            self.profile.config_overrides = self.modified_config.copy()
-            self.profile.save()
-            self.dismiss(("saved", self.profile.name))
-
-        elif event.button.id == "cancel-button":
-            # Discard changes and return
-            self.dismiss(("cancelled", None))
-
-        elif event.button.id == "delete-button":
-            self._show_delete_confirmation(
-                self.profile.name, self._handle_profile_deletion
-            )
+        handler = self._BUTTON_HANDLERS.get(event.button.id)
+        if handler is not None:
+            getattr(self, handler)()
+
+    def _save_profile(self) -> None:
+        """Save changes to the profile and return."""
+        self.profile.set_overrides(self.modified_config.copy())
+        self.profile.save()
+        self.dismiss(("saved", self.profile.name))
+
+    def _cancel_changes(self) -> None:
+        """Discard changes and return."""
+        self.dismiss(("cancelled", None))
+
+    def _confirm_profile_deletion(self) -> None:
+        """Ask for confirmation before deleting the profile."""
+        self._show_delete_confirmation(self.profile.name, self._handle_profile_deletion)
 
     def _handle_profile_deletion(self, confirmed: bool, profile_name: str) -> None:
         """Handle the result of profile deletion confirmation.
@@ -527,6 +579,12 @@ class ProfileSelectScreen(Screen):
         """Initialize the profile selection screen."""
         super().__init__()
         self.selected_profile: Optional[str] = None
+        self._delete_button = Button(
+            "Delete Selected Profile",
+            variant="error",
+            id="delete-button",
+            disabled=True,
+        )
 
     def compose(self) -> ComposeResult:
         """Compose the profile selection screen.
@@ -545,12 +603,7 @@ class ProfileSelectScreen(Screen):
                     "Press Enter to Select/Create • Press Delete to delete selected profile",
                     classes="stat-line",
                 )
-                yield Button(
-                    "Delete Selected Profile",
-                    variant="error",
-                    id="delete-button",
-                    disabled=True,
-                )
+                yield self._delete_button
 
     async def on_mount(self) -> None:
         """Initialize the screen with profile list and focus."""
@@ -570,30 +623,29 @@ class ProfileSelectScreen(Screen):
         """
         if event.item is None:
             self.selected_profile = None
-            delete_button = self.query_one("#delete-button")
-            delete_button.disabled = True
+            self._delete_button.disabled = True
             return
 
         self.selected_profile = event.item.id
-        delete_button = self.query_one("#delete-button")
-        delete_button.disabled = False
+        self._delete_button.disabled = False
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    async def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle existing profile selection.
 
+        The profile is read in a worker thread so disk I/O does not block
+        the event loop.
+
         Args:
             event: List view selection event
         """
-        profile = UserProfile.load(event.item.id)
+        profile = await asyncio.to_thread(UserProfile.load, event.item.id)
         self.dismiss(profile)
 
     def action_delete_profile(self) -> None:
         """Handle delete key press to delete selected profile."""
-        if self.selected_profile:
-            delete_button = self.query_one("#delete-button")
-            if not delete_button.disabled:
-                # Simulate delete button press
-                self.on_button_pressed(Button.Pressed(delete_button))
+        if self.selected_profile and not self._delete_button.disabled:
+            # Simulate delete button press
+            self.on_button_pressed(Button.Pressed(self._delete_button))
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press for delete button.
@@ -647,21 +699,35 @@ class ProfileSelectScreen(Screen):
             ):
                 self.app.profile = None
                 self.notify("Current profile cleared. Please select a new profile.")
-            # Refresh list and reset selection
+            # Remove the deleted item and reset selection
             self.selected_profile = None
-            delete_button = self.query_one("#delete-button")
-            delete_button.disabled = True
+            self._delete_button.disabled = True
 
-            async def refresh_and_update_focus():
-                await self.refresh_list()
+            async def remove_and_update_focus():
                 lst = self.query_one("#profile-list")
+                position = next(
+                    (
+                        i
+                        for i, item in enumerate(lst.children)
+                        if item.id == profile_name
+                    ),
+                    None,
+                )
+                if position is None:
+                    # Item not found, so rebuild the whole list instead
+                    await self.refresh_list()
+                    lst.index = None
+                else:
+                    # pop() moves the highlight to a neighbouring item
+                    await lst.pop(position)
                 if lst.children:
                     lst.focus()
-                    lst.index = 0
+                    if lst.index is None:
+                        lst.index = 0
                 else:
                     self.query_one("#new-profile-input").focus()
 
-            self.app.run_worker(refresh_and_update_focus)
+            self.app.run_worker(remove_and_update_focus)
         else:
             self.notify(
                 f"Failed to delete profile '{profile_name}'.",
@@ -671,25 +737,41 @@ class ProfileSelectScreen(Screen):
     async def refresh_list(self) -> None:
         """Refresh the list of available profiles.
 
-        Loads profiles from disk and populates the list view.
+        Loads profiles from disk and updates the list view in place,
+        removing items for vanished profiles and appending new ones.
         """
-        lst = self.query_one("#profile-list")
-        await lst.clear()
-        for p in UserProfile.list_profiles():
-            lst.append(
-                ListItem(Label(p.title()), id=p.strip().lower().replace(" ", "_"))
+        lst = self.query_one("#profile-list", ListView)
+        # Scan the profiles directory off the event loop
+        names = await asyncio.to_thread(UserProfile.list_profiles, True)
+        profiles = {p.strip().lower().replace(" ", "_"): p for p in names}
+        stale = [i for i, item in enumerate(lst.children) if item.id not in profiles]
+        # Removals and additions land in a single repaint
+        with self.app.batch_update():
+            if stale:
+                await lst.remove_items(stale)
+            present = {item.id for item in lst.children}
+            # Mount all new items in one batch rather than one mount per profile
+            await lst.extend(
+                ListItem(Label(name.title()), id=item_id)
+                for item_id, name in profiles.items()
+                if item_id not in present
             )
 
-    def on_input_submitted(self, event: Input.Submitted) -> None:
+    async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle new profile creation.
 
+        Loading and saving run in a worker thread so disk I/O does not
+        block the event loop.
+
         Args:
             event: Input submission event containing profile name
         """
         name = event.value.strip()
         if name:
-            profile = UserProfile.load(name) or UserProfile(name=name)
-            profile.save()
+            profile = await asyncio.to_thread(UserProfile.load, name)
+            if profile is None:
+                profile = UserProfile(name=name)
+            await asyncio.to_thread(profile.save)
             self.dismiss(profile)
 
 
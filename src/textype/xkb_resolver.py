@@ -4,7 +4,7 @@ This module provides functionality to map physical key scancodes to
 characters based on the current keyboard layout using the XKB library.
 """
 import xkbcommon.xkb as xkb
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 class XKBResolver:
@@ -14,24 +14,61 @@ class XKBResolver:
     based on the current keyboard layout and modifier state (shift, altgr).
 
     Attributes:
-        ctx: XKB context for keymap creation
-        keymap: XKB keymap representing the current keyboard layout
-        state: XKB state tracking modifier keys
+        ctx: XKB context for keymap creation, or None until first use
+        keymap: XKB keymap representing the current keyboard layout, or None
+            until first use
+        state: XKB state tracking modifier keys, or None until first use
     """
 
     def __init__(self) -> None:
         """Initialize the XKB resolver with current system layout.
 
-        Creates a new XKB context and loads the keymap from system
-        defaults (respecting XKB_DEFAULT_LAYOUT environment variable).
+        The XKB context and keymap are created on first use rather than
+        here, so constructing a resolver does no FFI work. The keymap is
+        loaded from system defaults (respecting XKB_DEFAULT_LAYOUT
+        environment variable).
 
         Example:
             >>> resolver = XKBResolver()
             >>> # Ready to resolve keys based on current layout
         """
-        self.ctx = xkb.Context()
-        self.keymap = self.ctx.keymap_new_from_names()
-        self.state = self.keymap.state_new()
+        self.ctx: Optional[xkb.Context] = None
+        self.keymap: Optional[xkb.Keymap] = None
+        self.state: Optional[xkb.KeyboardState] = None
+        self._shift_bit = 0
+        self._altgr_bit: Optional[int] = None
+        self._mods = 0
+        # The keymap never changes, so results stay valid for every modifier
+        # mask; at most four masks times the scancode range are ever stored
+        self._cache: Dict[Tuple[int, int], Optional[str]] = {}
+
+    def _ensure_state(self) -> "xkb.KeyboardState":
+        """Create the XKB context, keymap and state on first use.
+
+        Returns:
+            The XKB state used for resolution
+        """
+        if self.state is None:
+            self.ctx = xkb.Context()
+            self.keymap = self.ctx.keymap_new_from_names()
+            self.state = self.keymap.state_new()
+            # Modifier indices are fixed for the keymap, so resolve them once
+            self._shift_bit = self._mod_bit("Shift")
+        return self.state
+
+    def _mod_bit(self, name: str) -> int:
+        """Return the mask bit for a named modifier in the loaded keymap.
+
+        Args:
+            name: XKB modifier name, e.g. "Shift" or "Mod5"
+
+        Returns:
+            The modifier's mask bit, or 0 if the keymap does not define it
+        """
+        try:
+            return 1 << self.keymap.mod_get_index(name)
+        except xkb.XKBModifierDoesNotExist:
+            return 0
 
     def update_modifiers(self, shift: bool = False, altgr: bool = False) -> None:
         """Update the modifier state for character resolution.
@@ -45,18 +82,14 @@ class XKBResolver:
             >>> resolver.update_modifiers(shift=True)
             >>> # Now resolve() will return shifted characters
         """
-        mods = 0
-
-        def mod(name: str) -> int:
-            """Get modifier index by name."""
-            return self.keymap.mod_get_index(name)
-
-        if shift:
-            mods |= 1 << mod("Shift")
-        if altgr:
-            mods |= 1 << mod("ISO_Level3_Shift")
-
-        self.state.update_mask(mods, 0, 0, 0, 0, 0)
+        state = self._ensure_state()
+        if altgr and self._altgr_bit is None:
+            # AltGr (ISO_Level3_Shift) sets the LevelThree modifier, which
+            # standard keymaps map onto Mod5
+            self._altgr_bit = self._mod_bit("Mod5")
+        mods = (self._shift_bit if shift else 0) | (self._altgr_bit if altgr else 0)
+        self._mods = mods
+        state.update_mask(mods, 0, 0, 0, 0, 0)
 
     def resolve(self, evdev_code: int) -> Optional[str]:
         """Resolve an evdev scancode to a character.
@@ -78,9 +111,19 @@ class XKBResolver:
 
         Note:
             Evdev scancodes need +8 offset to convert to XKB keycodes.
+            Results are cached per modifier mask and scancode.
         """
+        cache_key = (self._mods, evdev_code)
+        try:
+            return self._cache[cache_key]
+        except KeyError:
+            pass
+
         xkb_code = evdev_code + 8  # IMPORTANT: evdev to XKB offset
-        sym = self.state.key_get_one_sym(xkb_code)
+        sym = self._ensure_state().key_get_one_sym(xkb_code)
         if sym == xkb.lib.XKB_KEY_NoSymbol:
-            return None
-        return xkb.keysym_to_string(sym)
+            char = None
+        else:
+            char = xkb.keysym_to_string(sym)
+        self._cache[cache_key] = char
+        return char
@@ -1,15 +1,47 @@
 """Unit tests for the code_generator module."""
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, mock_open
 
 import pytest
 from textype.code_generator import generate_code_snippet, generate_code_snippet_async
 
 
+@pytest.fixture
+def mock_check_output(monkeypatch):
+    """Replaces subprocess.check_output as seen by the code generator."""
+    mock = MagicMock()
+    monkeypatch.setattr("textype.code_generator.subprocess.check_output", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_post(monkeypatch):
+    """Replaces requests.post as seen by the code generator."""
+    mock = MagicMock()
+    monkeypatch.setattr("textype.code_generator.requests.post", mock)
+    return mock
+
+
+@pytest.fixture
+def stub_path(monkeypatch):
+    """Replaces Path in the code generator with a stub whose exists() is settable."""
+
+    class StubPath:
+        exists_result = False
+
+        def __init__(self, path):
+            self.path = path
+
+        def exists(self):
+            return StubPath.exists_result
+
+    monkeypatch.setattr("textype.code_generator.Path", StubPath)
+    return StubPath
+
+
 class TestGenerateCodeSnippet:
     """Tests the generate_code_snippet function for various data sources."""
 
-    @patch("textype.code_generator.subprocess.check_output")
     def test_generate_code_cmd_success(self, mock_check_output):
         """Tests successful code snippet generation from a command."""
         mock_check_output.return_value = b"code from command"
@@ -19,19 +51,15 @@ class TestGenerateCodeSnippet:
 
         assert snippet == "code from command"
 
-    @patch(
-        "textype.code_generator.subprocess.check_output",
-        side_effect=Exception("Cmd Error"),
-    )
     def test_generate_code_cmd_failure_fallback(self, mock_check_output):
         """Tests fallback to local snippets when a command fails."""
+        mock_check_output.side_effect = Exception("Cmd Error")
         config = {"CODE_SOURCE": "cmd", "CODE_COMMAND": "invalid-cmd"}
         snippet = generate_code_snippet(config_overrides=config)
 
         assert isinstance(snippet, str)
         assert len(snippet) > 0
 
-    @patch("textype.code_generator.requests.post")
     def test_generate_code_ai_openai_success(self, mock_post):
         """Tests successful code snippet generation from the OpenAI API."""
         mock_response = MagicMock()
@@ -51,7 +79,6 @@ class TestGenerateCodeSnippet:
 
         assert snippet == "code from openai"
 
-    @patch("textype.code_generator.requests.post")
     def test_generate_code_ai_ollama_success(self, mock_post):
         """Tests successful code snippet generation from the Ollama API."""
         mock_response = MagicMock()
@@ -69,21 +96,23 @@ class TestGenerateCodeSnippet:
 
         assert snippet == "code from ollama"
 
-    @patch("textype.code_generator.requests.post", side_effect=Exception("AI Error"))
     def test_generate_code_ai_failure_fallback(self, mock_post):
         """Tests fallback to local snippets when the AI API fails."""
+        mock_post.side_effect = Exception("AI Error")
         config = {"CODE_SOURCE": "ai", "AI_ENDPOINT": "http://ai.api"}
         snippet = generate_code_snippet(config_overrides=config)
 
         assert isinstance(snippet, str)
         assert len(snippet) > 0
 
-    @patch("textype.code_generator.Path.exists", return_value=True)
-    @patch("builtins.open")
-    def test_generate_code_file_success(self, mock_open, mock_exists):
+    def test_generate_code_file_success(self, stub_path, monkeypatch):
         """Tests successful code snippet generation from a file."""
-        mock_open.return_value.__enter__.return_value.read.return_value = (
-            "code from file"
+        stub_path.exists_result = True
+        # Only the module's own open() is replaced, not builtins.open
+        monkeypatch.setattr(
+            "textype.code_generator.open",
+            mock_open(read_data="code from file"),
+            raising=False,
         )
 
         config = {"CODE_SOURCE": "file", "CODE_FILE": "test.py"}
@@ -91,9 +120,9 @@ class TestGenerateCodeSnippet:
 
         assert snippet == "code from file"
 
-    @patch("textype.code_generator.Path.exists", return_value=False)
-    def test_generate_code_file_not_found_fallback(self, mock_exists):
+    def test_generate_code_file_not_found_fallback(self, stub_path):
         """Tests fallback to local snippets when a file is not found."""
+        stub_path.exists_result = False
         config = {"CODE_SOURCE": "file", "CODE_FILE": "nonexistent.py"}
         snippet = generate_code_snippet(config_overrides=config)
 
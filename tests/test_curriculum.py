@@ -2,6 +2,9 @@
 
 from textype.curriculum import LESSONS, SENTENCES, LessonDict
 
+_REQUIRED_LESSON_KEYS = tuple(LessonDict.__annotations__)
+"""Keys every lesson must define, taken from the LessonDict annotations."""
+
 
 class TestCurriculum:
     """Tests the structure and content of the curriculum data."""
@@ -13,9 +16,8 @@ class TestCurriculum:
 
     def test_lesson_keys(self):
         """Ensures each lesson has the required keys."""
-        required_keys = LessonDict.__annotations__.keys()
         for lesson in LESSONS:
-            assert all(key in lesson for key in required_keys)
+            assert all(key in lesson for key in _REQUIRED_LESSON_KEYS)
 
     def test_lesson_data_types(self):
         """Verifies the data types of the values in each lesson dictionary."""
@@ -1,39 +1,61 @@
 """Unit tests for the keyboard module."""
 
+from itertools import chain
+
+import pytest
+
 from textype.keyboard import PhysicalKey, KEYBOARD_ROWS, FINGER_MAP, LAYOUT, DISPLAY_MAP
 
+_VALID_FINGERS = frozenset({"L1", "L2", "L3", "L4", "R1", "R2", "R3", "R4", "THUMB"})
+"""Finger identifiers that FINGER_MAP may assign."""
+
 
 class TestKeyboardLayout:
     """Tests the integrity and consistency of keyboard layout data structures."""
 
     def test_physical_key_enum_uniqueness(self):
         """Tests that all PhysicalKey enum values are unique."""
-        values = [key.value for key in PhysicalKey]
-        assert len(values) == len(set(values))
+        # Duplicate values become aliases, which iteration over the enum hides
+        # but __members__ lists; the value map holds one entry per value
+        assert len(PhysicalKey._value2member_map_) == len(PhysicalKey.__members__)
 
     def test_keyboard_rows_structure(self):
-        """Ensures KEYBOARD_ROWS is a list of lists containing PhysicalKey enums."""
-        assert isinstance(KEYBOARD_ROWS, list)
+        """Ensures KEYBOARD_ROWS is a tuple of tuples containing PhysicalKey enums."""
+        assert isinstance(KEYBOARD_ROWS, tuple)
         for row in KEYBOARD_ROWS:
-            assert isinstance(row, list)
+            assert isinstance(row, tuple)
             assert all(isinstance(key, PhysicalKey) for key in row)
 
     def test_all_keys_in_finger_map(self):
         """Verifies that all non-modifier keys in KEYBOARD_ROWS are in FINGER_MAP."""
-        all_keys = {key for row in KEYBOARD_ROWS for key in row}
         # Assuming certain keys like ESC might not have a finger mapping
-        keys_requiring_finger = {
-            k for k in all_keys if k not in {PhysicalKey.KEY_ESCAPE}
-        }
+        missing = frozenset(chain.from_iterable(KEYBOARD_ROWS)).difference(
+            FINGER_MAP, {PhysicalKey.KEY_ESCAPE}
+        )
+        assert not missing, (
+            f"missing from FINGER_MAP: {sorted(key.name for key in missing)}"
+        )
+
+    def test_finger_map_read_only(self):
+        """Ensures FINGER_MAP cannot be modified at runtime."""
+        with pytest.raises(TypeError):
+            FINGER_MAP[PhysicalKey.KEY_A] = "R1"
 
-        for key in keys_requiring_finger:
-            assert key in FINGER_MAP, f"{key.name} is missing from FINGER_MAP"
+    def test_finger_map_assignments(self):
+        """Spot-checks finger assignments derived from the row/column layout."""
+        assert FINGER_MAP[PhysicalKey.KEY_TILDE] == "L1"
+        assert FINGER_MAP[PhysicalKey.KEY_5] == "L4"
+        assert FINGER_MAP[PhysicalKey.KEY_Y] == "R1"
+        assert FINGER_MAP[PhysicalKey.KEY_K] == "R2"
+        assert FINGER_MAP[PhysicalKey.KEY_ENTER] == "R4"
+        assert FINGER_MAP[PhysicalKey.KEY_SHIFT_LEFT] == "L1"
+        assert FINGER_MAP[PhysicalKey.KEY_SPACE] == "THUMB"
+        assert PhysicalKey.KEY_ESCAPE not in FINGER_MAP
 
     def test_finger_map_values(self):
         """Checks that FINGER_MAP values are valid finger identifiers."""
-        valid_fingers = {"L1", "L2", "L3", "L4", "R1", "R2", "R3", "R4", "THUMB"}
         for finger in FINGER_MAP.values():
-            assert finger in valid_fingers
+            assert finger in _VALID_FINGERS
 
     def test_layout_structure(self):
         """Ensures LAYOUT has the correct structure."""
@@ -49,8 +71,10 @@ class TestKeyboardLayout:
     def test_layout_keys(self):
         """Verifies that all keys in LAYOUT are PhysicalKey enums."""
         for row_layout in LAYOUT.values():
-            for hand in ["left", "right"]:
-                assert all(isinstance(key, PhysicalKey) for key in row_layout[hand])
+            assert all(
+                isinstance(key, PhysicalKey)
+                for key in chain(row_layout["left"], row_layout["right"])
+            )
 
     def test_display_map_keys(self):
         """Checks that all keys in DISPLAY_MAP are PhysicalKey enums."""
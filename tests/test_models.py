@@ -2,12 +2,35 @@
 
 import json
 import os
+import shutil
+import sys
+from dataclasses import fields
 from unittest.mock import patch
 
 import pytest
 
+import textype.curriculum as curriculum
+import textype.models as models
 from textype.models import UserProfile, DEFAULT_CONFIG, INITIAL_PROFILE_OVERRIDES
 
+_PROFILE_BYTES: bytes = json.dumps(
+    {
+        "name": "test_user",
+        "current_lesson_index": 5,
+        "wpm_record": 100,
+        "total_drills": 50,
+        "level": 3,
+        "config_overrides": {"SHOW_FINGERS": True},
+    }
+).encode()
+"""Serialized profile file contents for load tests, encoded once at import."""
+
+
+@pytest.fixture
+def user_profile():
+    """Provides a sample UserProfile for testing."""
+    return UserProfile(name="test_user")
+
 
 @pytest.fixture
 def temp_config_dir(tmp_path):
@@ -19,7 +42,7 @@ def temp_config_dir(tmp_path):
 def mock_global_config_path(temp_config_dir):
     """Mocks the GLOBAL_CONFIG_PATH constant for tests."""
     config_file = temp_config_dir / "config.json"
-    with patch("textype.models.GLOBAL_CONFIG_PATH", str(config_file)):
+    with patch.object(models, "GLOBAL_CONFIG_PATH", str(config_file)):
         yield str(config_file)
 
 
@@ -28,63 +51,56 @@ class TestConfigHierarchy:
 
     def test_load_global_config_exists(self, mock_global_config_path):
         """Tests that load_global_config correctly reads a JSON file from disk."""
-        from textype.models import load_global_config
-
         test_data = {"DRILL_DURATION": 999, "AI_MODEL": "test-model"}
         os.makedirs(os.path.dirname(mock_global_config_path), exist_ok=True)
         with open(mock_global_config_path, "w") as f:
             json.dump(test_data, f)
 
-        loaded = load_global_config()
+        loaded = models.load_global_config()
         assert loaded["DRILL_DURATION"] == 999
         assert loaded["AI_MODEL"] == "test-model"
 
     def test_load_global_config_missing(self, mock_global_config_path):
         """Tests that load_global_config returns an empty dict if file is missing."""
-        from textype.models import load_global_config
-
         if os.path.exists(mock_global_config_path):
             os.remove(mock_global_config_path)
 
-        assert load_global_config() == {}
+        assert models.load_global_config() == {}
 
-    def test_hierarchy_global_overrides_default(self):
+    def test_hierarchy_global_overrides_default(self, user_profile):
         """Tests that global configuration takes precedence over built-in defaults."""
-        profile = UserProfile(name="test_user")
         # Clear initial overrides to test global vs default
-        profile.config_overrides = {}
+        user_profile.config_overrides = {}
 
         mock_global = {"DRILL_DURATION": 123}
 
-        with patch("textype.models.GLOBAL_CONFIG", mock_global):
+        with patch.object(models, "GLOBAL_CONFIG", mock_global):
             # Should pull from Global (123) instead of Default (300)
-            assert profile.get_config("DRILL_DURATION") == 123
+            assert user_profile.get_config("DRILL_DURATION") == 123
             # Should still pull other values from Default
-            assert profile.get_config("HARD_MODE") == DEFAULT_CONFIG["HARD_MODE"]
+            assert user_profile.get_config("HARD_MODE") == DEFAULT_CONFIG["HARD_MODE"]
 
-    def test_hierarchy_profile_overrides_global(self):
+    def test_hierarchy_profile_overrides_global(self, user_profile):
         """Tests that profile-specific settings take precedence over global settings."""
-        profile = UserProfile(name="test_user")
-        profile.config_overrides = {"DRILL_DURATION": 10}
+        user_profile.config_overrides = {"DRILL_DURATION": 10}
 
         mock_global = {"DRILL_DURATION": 999}
 
-        with patch("textype.models.GLOBAL_CONFIG", mock_global):
+        with patch.object(models, "GLOBAL_CONFIG", mock_global):
             # Profile (10) wins over Global (999) and Default (300)
-            assert profile.get_config("DRILL_DURATION") == 10
+            assert user_profile.get_config("DRILL_DURATION") == 10
 
-    def test_merged_config_property_logic(self):
+    def test_merged_config_property_logic(self, user_profile):
         """Tests that the .config property merges all three layers correctly."""
-        profile = UserProfile(name="test_user")
-        profile.config_overrides = {"SHOW_QWERTY": True}
+        user_profile.config_overrides = {"SHOW_QWERTY": True}
 
         mock_global = {
             "DRILL_DURATION": 500,
             "SHOW_QWERTY": False,  # Should be overridden by profile
         }
 
-        with patch("textype.models.GLOBAL_CONFIG", mock_global):
-            merged = profile.config
+        with patch.object(models, "GLOBAL_CONFIG", mock_global):
+            merged = user_profile.config
 
             assert merged["SHOW_QWERTY"] is True  # Profile wins
             assert merged["DRILL_DURATION"] == 500  # Global wins
@@ -92,57 +108,107 @@ class TestConfigHierarchy:
             # Ensure no keys from DEFAULT_CONFIG are lost
             assert all(key in merged for key in DEFAULT_CONFIG)
 
+    def test_default_config_read_only(self):
+        """Ensures DEFAULT_CONFIG cannot be modified at runtime."""
+        with pytest.raises(TypeError):
+            DEFAULT_CONFIG["DRILL_DURATION"] = 1
+
+    def test_merged_base_follows_global_config(self):
+        """Tests that replacing GLOBAL_CONFIG is picked up by new merges."""
+        first = UserProfile(name="first")
+        first.config_overrides = {}
+        second = UserProfile(name="second")
+        second.config_overrides = {}
+
+        with patch.object(models, "GLOBAL_CONFIG", {"DRILL_DURATION": 111}):
+            assert first.config["DRILL_DURATION"] == 111
+        with patch.object(models, "GLOBAL_CONFIG", {"DRILL_DURATION": 222}):
+            assert second.config["DRILL_DURATION"] == 222
+
+
+@pytest.fixture(scope="session")
+def profiles_root(tmp_path_factory):
+    """Creates one parent directory shared by every profile test."""
+    return tmp_path_factory.mktemp("profiles")
+
 
 @pytest.fixture
-def temp_profile_dir(tmp_path):
-    """Creates a temporary directory for profile testing."""
-    return tmp_path / "profiles"
+def temp_profile_dir(profiles_root, request):
+    """Provides a per-test profile directory path under the shared root."""
+    path = profiles_root / request.node.name
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
 
 
 @pytest.fixture
-def mock_profiles_dir(temp_profile_dir):
-    """Mocks the PROFILES_DIR constant for tests."""
-    with patch("textype.models.PROFILES_DIR", str(temp_profile_dir)):
-        yield str(temp_profile_dir)
+def mock_profiles_dir(temp_profile_dir, monkeypatch):
+    """Points the PROFILES_DIR constant at a temporary directory for tests."""
+    monkeypatch.setattr(models, "PROFILES_DIR", str(temp_profile_dir))
+    return str(temp_profile_dir)
 
 
 class TestUserProfile:
     """Tests the UserProfile class for managing user data and settings."""
 
-    def test_profile_creation_defaults(self):
+    def test_profile_creation_defaults(self, user_profile):
         """Tests that a new profile is created with default values."""
-        profile = UserProfile(name="test_user")
-        assert profile.name == "test_user"
-        assert profile.current_lesson_index == 0
-        assert profile.wpm_record == 0
-        assert profile.total_drills == 0
-        assert profile.level == 1
-        assert profile.config_overrides == INITIAL_PROFILE_OVERRIDES
-
-    def test_get_config_with_override(self):
+        assert user_profile.name == "test_user"
+        assert user_profile.current_lesson_index == 0
+        assert user_profile.wpm_record == 0
+        assert user_profile.total_drills == 0
+        assert user_profile.level == 1
+        assert user_profile.config_overrides == INITIAL_PROFILE_OVERRIDES
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+    def test_profile_uses_slots(self, user_profile):
+        """Tests that profiles store their fields in slots, not a __dict__."""
+        assert not hasattr(user_profile, "__dict__")
+        with pytest.raises(AttributeError):
+            user_profile.nickname = "tester"
+
+    def test_get_config_with_override(self, user_profile):
         """Tests retrieving a config value that is overridden in the profile."""
-        profile = UserProfile(name="test_user")
-        profile.config_overrides["SHOW_QWERTY"] = True
-        assert profile.get_config("SHOW_QWERTY") is True
+        user_profile.set_override("SHOW_QWERTY", True)
+        assert user_profile.get_config("SHOW_QWERTY") is True
 
-    def test_get_config_with_default(self):
+    def test_get_config_with_default(self, user_profile):
         """Tests retrieving a config value that falls back to the default."""
-        profile = UserProfile(name="test_user")
-        assert profile.get_config("DRILL_DURATION") == DEFAULT_CONFIG["DRILL_DURATION"]
+        expected = DEFAULT_CONFIG["DRILL_DURATION"]
+        assert user_profile.get_config("DRILL_DURATION") == expected
 
-    def test_config_property(self):
+    def test_config_property(self, user_profile):
         """Tests that the config property merges overrides and defaults correctly."""
-        profile = UserProfile(name="test_user")
-        profile.config_overrides["HARD_MODE"] = False
-        merged_config = profile.config
+        user_profile.set_override("HARD_MODE", False)
+        merged_config = user_profile.config
         assert merged_config["HARD_MODE"] is False
         assert merged_config["DRILL_DURATION"] == DEFAULT_CONFIG["DRILL_DURATION"]
         assert "SHOW_QWERTY" in merged_config
 
-    def test_save_profile(self, mock_profiles_dir):
+    def test_config_property_cached_until_override_changes(self, user_profile):
+        """Tests that the merged config is reused and rebuilt after set_override."""
+        merged = user_profile.config
+        assert user_profile.config is merged
+
+        user_profile.set_override("DRILL_DURATION", 42)
+        assert user_profile.config is not merged
+        assert user_profile.config["DRILL_DURATION"] == 42
+
+    def test_config_property_rebuilt_after_set_overrides(self, user_profile):
+        """Tests that replacing the overrides through set_overrides rebuilds it."""
+        merged = user_profile.config
+
+        user_profile.set_overrides({"DRILL_DURATION": 42})
+        assert user_profile.config is not merged
+        assert user_profile.config["DRILL_DURATION"] == 42
+
+    def test_config_property_read_only(self, user_profile):
+        """Tests that the shared merged config cannot be modified in place."""
+        with pytest.raises(TypeError):
+            user_profile.config["DRILL_DURATION"] = 1
+
+    def test_save_profile(self, user_profile, mock_profiles_dir):
         """Tests saving a user profile to a file."""
-        profile = UserProfile(name="test_user")
-        profile.save()
+        user_profile.save()
 
         expected_path = os.path.join(mock_profiles_dir, "test_user.json")
         assert os.path.exists(expected_path)
@@ -152,22 +218,29 @@ class TestUserProfile:
 
         assert data["name"] == "test_user"
         assert data["current_lesson_index"] == 0
+        # Every init field is persisted, and nothing else
+        assert set(data) == {f.name for f in fields(UserProfile) if f.init}
+
+    def test_save_profile_failed_write_keeps_previous_file(self, mock_profiles_dir):
+        """Tests that a failed save leaves the existing profile file intact."""
+        profile = UserProfile(name="test_user", wpm_record=40)
+        profile.save()
+        profile.wpm_record = 80
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                profile.save()
+
+        assert os.listdir(mock_profiles_dir) == ["test_user.json"]
+        with open(os.path.join(mock_profiles_dir, "test_user.json")) as f:
+            assert json.load(f)["wpm_record"] == 40
 
     def test_load_profile(self, mock_profiles_dir):
         """Tests loading a user profile from a file."""
-        profile_data = {
-            "name": "test_user",
-            "current_lesson_index": 5,
-            "wpm_record": 100,
-            "total_drills": 50,
-            "level": 3,
-            "config_overrides": {"SHOW_FINGERS": True},
-        }
-
         profile_path = os.path.join(mock_profiles_dir, "test_user.json")
         os.makedirs(mock_profiles_dir, exist_ok=True)
-        with open(profile_path, "w") as f:
-            json.dump(profile_data, f)
+        with open(profile_path, "wb") as f:
+            f.write(_PROFILE_BYTES)
 
         profile = UserProfile.load("test_user")
 
@@ -177,6 +250,28 @@ class TestUserProfile:
         assert profile.wpm_record == 100
         assert profile.get_config("SHOW_FINGERS") is True
 
+    def test_load_profile_uses_cache_until_file_changes(self, mock_profiles_dir):
+        """Tests that repeated loads reuse the parsed profile until the file changes."""
+        profile = UserProfile(name="test_user", wpm_record=42)
+        profile.save()
+
+        first = UserProfile.load("test_user")
+        second = UserProfile.load("test_user")
+        assert first == second
+        assert first is not second
+        assert first.config_overrides is not second.config_overrides
+
+        profile_path = os.path.join(mock_profiles_dir, "test_user.json")
+        with open(profile_path, "r") as f:
+            data = json.load(f)
+        data["wpm_record"] = 99
+        with open(profile_path, "w") as f:
+            json.dump(data, f)
+        stat = os.stat(profile_path)
+        os.utime(profile_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert UserProfile.load("test_user").wpm_record == 99
+
     def test_load_nonexistent_profile(self, mock_profiles_dir):
         """Tests that loading a non-existent profile returns None."""
         profile = UserProfile.load("nonexistent_user")
@@ -186,20 +281,38 @@ class TestUserProfile:
         """Tests listing all available user profiles."""
         os.makedirs(mock_profiles_dir, exist_ok=True)
 
-        # Create some dummy profile files
-        (UserProfile(name="alice").save())
-        (UserProfile(name="bob").save())
+        # Listing only looks at names, so empty files stand in for profiles
+        for name in ("alice.json", "bob.json", "carol_dee.json", "notes.txt"):
+            open(os.path.join(mock_profiles_dir, name), "w").close()
+        os.mkdir(os.path.join(mock_profiles_dir, "backup.json"))
 
         profiles = UserProfile.list_profiles()
 
-        assert "alice" in profiles
-        assert "bob" in profiles
-        assert len(profiles) == 2
+        assert sorted(profiles) == ["alice", "bob", "carol dee"]
+
+    def test_list_profiles_cached(self, mock_profiles_dir):
+        """Tests that cached listings are reused until the profiles change."""
+        UserProfile(name="alice").save()
+        assert UserProfile.list_profiles(cached=True) == ["alice"]
 
-    def test_delete_profile(self, mock_profiles_dir):
+        # An unchanged directory is not rescanned
+        with patch("os.scandir") as mock_scandir:
+            assert UserProfile.list_profiles(cached=True) == ["alice"]
+        mock_scandir.assert_not_called()
+
+        # A file created by another process is seen once the mtime moves
+        mtime = os.stat(mock_profiles_dir).st_mtime_ns
+        with open(os.path.join(mock_profiles_dir, "bob.json"), "w") as f:
+            json.dump({"name": "bob"}, f)
+        os.utime(mock_profiles_dir, ns=(mtime, mtime + 10**9))
+        assert sorted(UserProfile.list_profiles(cached=True)) == ["alice", "bob"]
+
+        UserProfile.delete("alice")
+        assert UserProfile.list_profiles(cached=True) == ["bob"]
+
+    def test_delete_profile(self, user_profile, mock_profiles_dir):
         """Tests deleting a user profile."""
-        profile = UserProfile(name="test_user")
-        profile.save()
+        user_profile.save()
 
         assert UserProfile.delete("test_user") is True
         assert not os.path.exists(os.path.join(mock_profiles_dir, "test_user.json"))
@@ -208,14 +321,18 @@ class TestUserProfile:
         """Tests that deleting a non-existent profile returns False."""
         assert UserProfile.delete("nonexistent_user") is False
 
-    @patch("textype.curriculum.LESSONS", [{"name": "Lesson 1"}, {"name": "Lesson 2"}])
-    def test_get_current_lesson_name(self):
+    def test_get_current_lesson_name(self, monkeypatch):
         """Tests retrieving the name of the current lesson."""
         profile = UserProfile(name="test_user", current_lesson_index=1)
+        monkeypatch.setattr(
+            curriculum, "LESSONS", [{"name": "Lesson 1"}, {"name": "Lesson 2"}]
+        )
         assert profile.get_current_lesson_name() == "Lesson 2"
 
-    @patch("textype.curriculum.LESSONS", [{"name": "Lesson 1"}])
-    def test_get_current_lesson_name_out_of_bounds(self):
+    def test_get_current_lesson_name_out_of_bounds(self, monkeypatch):
         """Tests that 'Unknown' is returned for an out-of-bounds lesson index."""
         profile = UserProfile(name="test_user", current_lesson_index=5)
+        monkeypatch.setattr(curriculum, "LESSONS", [{"name": "Lesson 1"}])
+        assert profile.get_current_lesson_name() == "Unknown"
+        profile.current_lesson_index = -1
         assert profile.get_current_lesson_name() == "Unknown"
@@ -1,41 +1,67 @@
 """Unit tests for the sentence_generator module."""
 
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
+from textype.curriculum import SENTENCES
 from textype.sentence_generator import generate_sentence, generate_sentence_async
 
 
+def _offline(*args, **kwargs):
+    """Stands in for HTTP calls that a test has not configured."""
+    raise ConnectionError("network access is disabled in tests")
+
+
+def _ok_response(payload):
+    """Builds a successful HTTP response stub returning payload from json()."""
+    return SimpleNamespace(status_code=200, json=lambda: payload)
+
+
+class Recorder:
+    """Callable stub that records its calls and returns a fixed result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def fake_session(monkeypatch):
+    """Replaces the shared HTTP session with a namespace whose get/post are settable."""
+    session = SimpleNamespace(get=_offline, post=_offline)
+    monkeypatch.setattr("textype.sentence_generator._SESSION", session)
+    return session
+
+
 class TestGenerateSentence:
     """Tests the generate_sentence function for various data sources."""
 
-    @patch("textype.sentence_generator.requests.get")
-    def test_generate_sentence_api_success(self, mock_get):
+    def test_generate_sentence_api_success(self, fake_session):
         """Tests successful sentence generation from an API."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"text": "A quote from API.", "author": "API"}
-        mock_get.return_value = mock_response
+        fake_session.get = Recorder(
+            _ok_response({"text": "A quote from API.", "author": "API"})
+        )
 
         config = {"SENTENCE_SOURCE": "api", "QUOTE_API_URL": "http://test.api"}
         sentence = generate_sentence(config)
 
         assert "A quote from API." in sentence
         assert "API" in sentence
-        mock_get.assert_called_once_with("http://test.api", timeout=2)
+        assert fake_session.get.calls == [(("http://test.api",), {"timeout": 2})]
 
-    @patch(
-        "textype.sentence_generator.requests.get", side_effect=Exception("API Error")
-    )
-    @patch("textype.sentence_generator.random.choice")
-    def test_generate_sentence_api_failure_fallback(self, mock_choice, mock_get):
+    @patch("textype.sentence_generator.random.randrange", return_value=0)
+    def test_generate_sentence_api_failure_fallback(self, mock_randrange, fake_session):
         """Tests fallback to local sentences when the API fails."""
-        mock_choice.return_value = "A local sentence."
-
+        # The unconfigured fake session raises, as an unreachable API would
         config = {"SENTENCE_SOURCE": "api", "QUOTE_API_URL": "http://test.api"}
         sentence = generate_sentence(config)
 
-        assert sentence == "A local sentence."
+        assert sentence == SENTENCES[0]
 
     @patch("textype.sentence_generator.subprocess.check_output")
     def test_generate_sentence_cmd_success(self, mock_check_output):
@@ -54,49 +80,58 @@ class TestGenerateSentence:
         "textype.sentence_generator.subprocess.check_output",
         side_effect=Exception("Cmd Error"),
     )
-    @patch("textype.sentence_generator.random.choice")
+    @patch("textype.sentence_generator.random.randrange", return_value=0)
     def test_generate_sentence_cmd_failure_fallback(
-        self, mock_choice, mock_check_output
+        self, mock_randrange, mock_check_output
     ):
         """Tests fallback to local sentences when a command fails."""
-        mock_choice.return_value = "A local sentence."
-
         config = {"SENTENCE_SOURCE": "cmd", "CODE_COMMAND": "invalid-cmd"}
         sentence = generate_sentence(config)
 
-        assert sentence == "A local sentence."
+        assert sentence == SENTENCES[0]
 
-    @patch("textype.sentence_generator.Path.exists", return_value=True)
-    @patch("builtins.open")
-    def test_generate_sentence_file_success(self, mock_open, mock_exists):
+    def test_generate_sentence_file_success(self, tmp_path):
         """Tests successful sentence generation from a file."""
-        mock_open.return_value.__enter__.return_value = ["Sentence from file.\n"]
+        path = tmp_path / "test.txt"
+        path.write_text("Sentence from file.\n\n")
 
-        config = {"SENTENCE_SOURCE": "file", "SENTENCES_FILE": "test.txt"}
+        config = {"SENTENCE_SOURCE": "file", "SENTENCES_FILE": str(path)}
         sentence = generate_sentence(config)
 
         assert sentence == "Sentence from file."
 
-    @patch("textype.sentence_generator.Path.exists", return_value=False)
-    @patch("textype.sentence_generator.random.choice")
-    def test_generate_sentence_file_not_found_fallback(self, mock_choice, mock_exists):
-        """Tests fallback to local sentences when a file is not found."""
-        mock_choice.return_value = "A local sentence."
+    def test_generate_sentence_file_cached_until_changed(self, tmp_path):
+        """Tests that file lines are cached until the file is modified."""
+        path = tmp_path / "test.txt"
+        path.write_text("First sentence.\n")
+        config = {"SENTENCE_SOURCE": "file", "SENTENCES_FILE": str(path)}
 
-        config = {"SENTENCE_SOURCE": "file", "SENTENCES_FILE": "nonexistent.txt"}
+        assert generate_sentence(config) == "First sentence."
+        with patch("textype.sentence_generator.Path.read_text") as mock_read:
+            assert generate_sentence(config) == "First sentence."
+            mock_read.assert_not_called()
+
+        path.write_text("Second, longer sentence.\n")
+        assert generate_sentence(config) == "Second, longer sentence."
+
+    @patch("textype.sentence_generator.random.randrange", return_value=0)
+    def test_generate_sentence_file_not_found_fallback(self, mock_randrange, tmp_path):
+        """Tests fallback to local sentences when a file is not found."""
+        config = {
+            "SENTENCE_SOURCE": "file",
+            "SENTENCES_FILE": str(tmp_path / "nonexistent.txt"),
+        }
         sentence = generate_sentence(config)
 
-        assert sentence == "A local sentence."
+        assert sentence == SENTENCES[0]
 
-    @patch("textype.sentence_generator.random.choice")
-    def test_generate_sentence_local_default(self, mock_choice):
+    @patch("textype.sentence_generator.random.randrange", return_value=0)
+    def test_generate_sentence_local_default(self, mock_randrange):
         """Tests default sentence generation from the local list."""
-        mock_choice.return_value = "A local sentence."
-
         config = {"SENTENCE_SOURCE": "local"}
         sentence = generate_sentence(config)
 
-        assert sentence == "A local sentence."
+        assert sentence == SENTENCES[0]
 
     @pytest.mark.asyncio
     @patch(
@@ -107,15 +142,25 @@ class TestGenerateSentence:
         sentence = await generate_sentence_async()
         assert sentence == "Async sentence"
 
-    @patch("textype.sentence_generator.requests.post")
-    def test_generate_sentence_ai_openai_success(self, mock_post):
+    @pytest.mark.asyncio
+    @patch("textype.sentence_generator.asyncio.to_thread")
+    @patch("textype.sentence_generator.random.randrange", return_value=0)
+    async def test_generate_sentence_async_local_skips_thread(
+        self, mock_randrange, mock_to_thread
+    ):
+        """Tests that the local source is generated without a worker thread."""
+        sentence = await generate_sentence_async({"SENTENCE_SOURCE": "local"})
+
+        assert sentence == SENTENCES[0]
+        mock_to_thread.assert_not_called()
+
+    def test_generate_sentence_ai_openai_success(self, fake_session):
         """Tests successful sentence generation from the OpenAI API."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Sentence from OpenAI."}}]
-        }
-        mock_post.return_value = mock_response
+        fake_session.post = Recorder(
+            _ok_response(
+                {"choices": [{"message": {"content": "Sentence from OpenAI."}}]}
+            )
+        )
 
         config = {
             "SENTENCE_SOURCE": "ai",
@@ -128,13 +173,11 @@ class TestGenerateSentence:
 
         assert sentence == "Sentence from OpenAI."
 
-    @patch("textype.sentence_generator.requests.post")
-    def test_generate_sentence_ai_ollama_success(self, mock_post):
+    def test_generate_sentence_ai_ollama_success(self, fake_session):
         """Tests successful sentence generation from the Ollama API."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "Sentence from Ollama."}
-        mock_post.return_value = mock_response
+        fake_session.post = Recorder(
+            _ok_response({"response": "Sentence from Ollama."})
+        )
 
         config = {
             "SENTENCE_SOURCE": "ai",
@@ -146,15 +189,11 @@ class TestGenerateSentence:
 
         assert sentence == "Sentence from Ollama."
 
-    @patch(
-        "textype.sentence_generator.requests.post", side_effect=Exception("AI Error")
-    )
-    @patch("textype.sentence_generator.random.choice")
-    def test_generate_sentence_ai_failure_fallback(self, mock_choice, mock_post):
+    @patch("textype.sentence_generator.random.randrange", return_value=0)
+    def test_generate_sentence_ai_failure_fallback(self, mock_randrange, fake_session):
         """Tests fallback to local sentences when the AI API fails."""
-        mock_choice.return_value = "A local sentence."
-
+        # The unconfigured fake session raises, as an unreachable API would
         config = {"SENTENCE_SOURCE": "ai", "AI_ENDPOINT": "http://ai.api"}
         sentence = generate_sentence(config)
 
-        assert sentence == "A local sentence."
+        assert sentence == SENTENCES[0]
@@ -1,56 +1,67 @@
 """Unit tests for the text_normalizer module."""
 
-import pytest
+from typing import List, Tuple
+
 from textype.text_normalizer import normalize_text
 
+_NORMALIZATION_CASES: List[Tuple[str, str]] = [
+    # Smart quotes and apostrophes
+    ("‘Hello’", "'Hello'"),
+    ("“World”", '"World"'),
+    ("It’s a test", "It's a test"),
+    # Dashes and hyphens
+    ("endash –", "endash -"),
+    ("emdash —", "emdash --"),
+    # Ellipsis
+    ("Wait…", "Wait..."),
+    # Spaces
+    ("Non-breaking space", "Non-breaking space"),
+    ("Zero​width space", "Zerowidth space"),
+    # Mathematical symbols
+    ("2 × 2 = 4", "2 x 2 = 4"),
+    ("10 ÷ 5 ≠ 1", "10 / 5 != 1"),
+    # Currency symbols
+    ("Cost: 5€", "Cost: 5EUR"),
+    ("Price: 10£", "Price: 10GBP"),
+    # Copyright and trademark symbols
+    ("Copyright © 2024", "Copyright (c) 2024"),
+    ("Company™", "CompanyTM"),
+    # Fractions
+    ("½ cup of sugar", "1/2 cup of sugar"),
+    # Arrows
+    ("Go right →", "Go right ->"),
+    # Other symbols
+    ("«Guillemets»", "<<Guillemets>>"),
+    # Combining characters (diacritics)
+    ("Crème brûlée", "Creme brulee"),
+    ("résumé", "resume"),
+    # Mixed Unicode and ASCII
+    ("“¡Hola, señorita!” – a greeting.", '"!Hola, senorita!" - a greeting.'),
+]
+"""(input, expected output) pairs covering each category of replacement."""
+
 
 class TestNormalizeText:
     """Tests the normalize_text function for Unicode to ASCII conversion."""
 
-    @pytest.mark.parametrize(
-        "input_text, expected_output",
-        [
-            # Smart quotes and apostrophes
-            ("‘Hello’", "'Hello'"),
-            ("“World”", '"World"'),
-            ("It’s a test", "It's a test"),
-            # Dashes and hyphens
-            ("endash –", "endash -"),
-            ("emdash —", "emdash --"),
-            # Ellipsis
-            ("Wait…", "Wait..."),
-            # Spaces
-            ("Non-breaking space", "Non-breaking space"),
-            ("Zero​width space", "Zerowidth space"),
-            # Mathematical symbols
-            ("2 × 2 = 4", "2 x 2 = 4"),
-            ("10 ÷ 5 ≠ 1", "10 / 5 != 1"),
-            # Currency symbols
-            ("Cost: 5€", "Cost: 5EUR"),
-            ("Price: 10£", "Price: 10GBP"),
-            # Copyright and trademark symbols
-            ("Copyright © 2024", "Copyright (c) 2024"),
-            ("Company™", "CompanyTM"),
-            # Fractions
-            ("½ cup of sugar", "1/2 cup of sugar"),
-            # Arrows
-            ("Go right →", "Go right ->"),
-            # Other symbols
-            ("«Guillemets»", "<<Guillemets>>"),
-            # Combining characters (diacritics)
-            ("Crème brûlée", "Creme brulee"),
-            ("résumé", "resume"),
-            # Mixed Unicode and ASCII
-            ("“¡Hola, señorita!” – a greeting.", '"!Hola, senorita!" - a greeting.'),
-        ],
-    )
-    def test_various_normalizations(self, input_text, expected_output):
+    def test_various_normalizations(self):
         """
         Tests a wide range of Unicode character normalizations.
-        This parameterized test covers multiple categories of special characters
-        to ensure they are correctly converted to their ASCII equivalents.
+        The cases cover multiple categories of special characters to ensure
+        they are correctly converted to their ASCII equivalents. Every
+        replacement is per character, so all cases are checked in one call
+        on their NUL-joined concatenation.
         """
-        assert normalize_text(input_text) == expected_output
+        inputs = "\x00".join(input_text for input_text, _ in _NORMALIZATION_CASES)
+        expected = "\x00".join(output for _, output in _NORMALIZATION_CASES)
+        assert normalize_text(inputs) == expected
+
+    def test_latin1_normalizations(self):
+        """Tests the Latin-1 cases together, which take the byte-level path."""
+        latin1 = [case for case in _NORMALIZATION_CASES if max(case[0]) <= "\xff"]
+        inputs = "\x00".join(input_text for input_text, _ in latin1)
+        expected = "\x00".join(output for _, output in latin1)
+        assert normalize_text(inputs) == expected
 
     def test_empty_string(self):
         """Tests that an empty string remains empty after normalization."""
@@ -60,3 +71,25 @@ class TestNormalizeText:
         """Tests that a string with no special characters remains unchanged."""
         text = "This is a simple ASCII string with no special characters."
         assert normalize_text(text) == text
+
+    def test_ascii_fast_path_returns_input(self):
+        """Tests that pure ASCII input is returned as-is without processing."""
+        text = "Plain ASCII with symbols: ~!@#$%^&*()_+{}|:<>?"
+        assert normalize_text(text) is text
+
+    def test_mixed_ascii_and_unicode(self):
+        """Tests that mostly-ASCII text with a few Unicode characters is normalized."""
+        text = "def f(x): return x \u2260 0  # na\u00efve \u2014 ok\u2026"
+        assert normalize_text(text) == "def f(x): return x != 0  # naive -- ok..."
+
+    def test_astral_characters(self):
+        """Tests text containing characters outside the Basic Multilingual Plane."""
+        assert normalize_text("\U0001d400bc — café") == "Abc -- cafe"
+
+    def test_translate_table_matches_fallback(self):
+        """Tests that the BMP translate table agrees with the NFKD fallback."""
+        text = "Ŝṭrïñg ½ “quoted” ﬁle Ⅷ"
+        expected = normalize_text(text)
+        assert expected == 'String 1/2 "quoted" file VIII'
+        # An astral character forces the whole string through the fallback
+        assert normalize_text(text + "\U0001d400") == expected + "A"
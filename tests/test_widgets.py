@@ -1,10 +1,14 @@
 """Unit tests for the widgets module."""
 
+from typing import Any, List, Tuple
+
 import pytest
+import pytest_asyncio
 from textual.widgets import Select, Input
 from textual.app import App
+from textual.geometry import Region
 from textype.widgets import (
-    FingerColumn,
+    FingerRow,
     StatsScreen,
     ConfigWidgetFactory,
     ProfileInfoScreen,
@@ -14,6 +18,14 @@ from textype.widgets import (
 from textype.models import UserProfile
 
 
+_WIDGET_CASES: List[Tuple[str, str, Any, Any, type, bool]] = [
+    ("PRACTICE_MODE", "Practice Mode", "curriculum", "curriculum", Select, False),
+    ("DRILL_DURATION", "Drill Duration", 300, 300, Input, False),
+    ("AI_API_KEY", "AI API Key", "", "", Input, True),
+]
+"""(key, label, value, default, widget type, password) for factory tests."""
+
+
 @pytest.fixture
 def user_profile():
     """Provides a sample UserProfile for testing."""
@@ -24,28 +36,76 @@ class TestApp(App):
     pass
 
 
-class TestFingerColumn:
-    """Tests the FingerColumn widget."""
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def app_pilot():
+    """Provides one running TestApp shared by every test in a class."""
+    app = TestApp()
+    async with app.run_test() as pilot:
+        yield pilot
+
 
-    def test_finger_column_init(self):
-        """Tests that the FingerColumn initializes correctly."""
-        fc = FingerColumn(fid="L1", height=5, width=7)
-        assert fc.fid == "L1"
-        assert fc.height == 5
-        assert fc.width == 7
+class FingerApp(App):
+    CSS = "FingerRow > .finger-row--active { text-style: bold; }"
+
+
+class TestFingerRow:
+    """Tests the FingerRow widget."""
+
+    def test_finger_row_init(self):
+        """Tests that the FingerRow lays fingers out left to right."""
+        row = FingerRow({"L1": (4, 7), "THUMB": (2, 20)})
+        assert row.fingers == {"L1": (4, 7), "THUMB": (2, 20)}
+        assert row.active == frozenset()
+        assert row._regions["L1"] == Region(0, 0, 9, 4)
+        assert row._regions["THUMB"] == Region(9, 2, 22, 2)
+
+    @pytest.mark.asyncio
+    async def test_finger_row_dimensions(self):
+        """Tests that the row is as wide as its fingers and as tall as the tallest."""
+        app = TestApp()
+        async with app.run_test() as pilot:
+            row = FingerRow({"L1": (5, 6), "R1": (3, 7)})
+            await app.mount(row)
+            await pilot.pause()
+            assert row.size.width == 6 + 7 + 4
+            assert row.size.height == 5
+
+    @pytest.mark.asyncio
+    async def test_finger_row_render(self):
+        """Tests the edge, label and highlight of each finger."""
+        app = FingerApp()
+        async with app.run_test() as pilot:
+            row = FingerRow({"L1": (4, 7), "R1": (3, 7)})
+            await app.mount(row)
+            await pilot.pause()
+            lines = [row.render_line(y).text for y in range(4)]
+            edge = "\u2500" * 7
+            assert lines == [
+                f" {edge} " + " " * 9,
+                " " * 10 + f"{edge} ",
+                "   L1       R1    ",
+                " " * 18,
+            ]
+
+            row.set_active(["R1"])
+            assert row.active == frozenset({"R1"})
+            label = row.render_line(2)
+            styles = {segment.text.strip(): segment.style for segment in label}
+            assert styles["R1"].bold
+            assert not styles["L1"].bold
 
 
 class TestStatsScreen:
     """Tests the StatsScreen."""
 
-    @pytest.mark.asyncio
-    async def test_stats_screen_init_and_compose(self):
+    def test_stats_screen_init_and_compose(self):
         """Tests initialization and composition of the StatsScreen."""
         screen = StatsScreen(wpm=50, accuracy=95, errors=2, passed=True)
         assert screen.wpm == 50
         assert screen.accuracy == 95
         assert screen.errors == 2
         assert screen.passed is True
+        assert screen._stats_body == "WPM: 50\n\nAccuracy: 95%\n\nErrors: 2"
 
 
 class TestConfigWidgetFactory:
@@ -63,37 +123,18 @@ class TestConfigWidgetFactory:
     #         assert isinstance(widget, Select)
     #         assert widget.value == "False"
 
-    @pytest.mark.asyncio
-    async def test_create_select_widget(self):
-        """Tests creation of a select widget."""
-        app = TestApp()
-        async with app.run_test():
-            widget, _ = ConfigWidgetFactory.create_widget(
-                "PRACTICE_MODE", "Practice Mode", "curriculum", "curriculum", {}
-            )
-            assert isinstance(widget, Select)
-
-    @pytest.mark.asyncio
-    async def test_create_input_widget(self):
-        """Tests creation of an input widget."""
-        app = TestApp()
-        async with app.run_test():
-            widget, _ = ConfigWidgetFactory.create_widget(
-                "DRILL_DURATION", "Drill Duration", 300, 300, {}
-            )
-            assert isinstance(widget, Input)
-            assert not widget.password
-
-    @pytest.mark.asyncio
-    async def test_create_password_input_widget(self):
-        """Tests creation of a password input widget for API keys."""
-        app = TestApp()
-        async with app.run_test():
-            widget, _ = ConfigWidgetFactory.create_widget(
-                "AI_API_KEY", "AI API Key", "", "", {}
-            )
-            assert isinstance(widget, Input)
-            assert widget.password is True
+    @pytest.mark.asyncio(loop_scope="class")
+    @pytest.mark.parametrize(
+        "key, label, value, default, widget_type, password", _WIDGET_CASES
+    )
+    async def test_create_widget(
+        self, app_pilot, key, label, value, default, widget_type, password
+    ):
+        """Tests the widget type created for select, input and API key settings."""
+        widget, _ = ConfigWidgetFactory.create_widget(key, label, value, default, {})
+        assert isinstance(widget, widget_type)
+        if widget_type is Input:
+            assert widget.password is password
 
 
 class TestProfileInfoScreen:
@@ -110,12 +151,30 @@ class TestProfileInfoScreen:
         screen._handle_config_change("input-SHOW_QWERTY", "False")
         assert screen.modified_config["SHOW_QWERTY"] is False
 
+    def test_handle_config_change_bool_spellings(self, user_profile):
+        """Tests that alternate boolean spellings map onto the default."""
+        screen = ProfileInfoScreen(profile=user_profile)
+        screen._handle_config_change("input-SHOW_QWERTY", " off ")
+        assert screen.modified_config["SHOW_QWERTY"] is False
+        screen._handle_config_change("input-SHOW_QWERTY", "Yes")
+        assert "SHOW_QWERTY" not in screen.modified_config
+
     def test_handle_config_change_int(self, user_profile):
         """Tests handling of an integer configuration change."""
         screen = ProfileInfoScreen(profile=user_profile)
         screen._handle_config_change("input-DRILL_DURATION", "120")
         assert screen.modified_config["DRILL_DURATION"] == 120
 
+    def test_handle_config_change_repeated_value(self, user_profile):
+        """Tests that a repeated change event for the same value is skipped."""
+        screen = ProfileInfoScreen(profile=user_profile)
+        screen._handle_config_change("input-DRILL_DURATION", "120")
+        screen.modified_config.pop("DRILL_DURATION")
+        screen._handle_config_change("input-DRILL_DURATION", "120")
+        assert "DRILL_DURATION" not in screen.modified_config
+        screen._handle_config_change("input-DRILL_DURATION", "90")
+        assert screen.modified_config["DRILL_DURATION"] == 90
+
     def test_handle_config_change_str(self, user_profile):
         """Tests handling of a string configuration change."""
         screen = ProfileInfoScreen(profile=user_profile)
@@ -126,8 +185,7 @@ class TestProfileInfoScreen:
 class TestProfileSelectScreen:
     """Tests the ProfileSelectScreen."""
 
-    @pytest.mark.asyncio
-    async def test_profile_select_screen_init_and_compose(self):
+    def test_profile_select_screen_init_and_compose(self):
         """Tests initialization and composition of the ProfileSelectScreen."""
         screen = ProfileSelectScreen()
         assert screen.selected_profile is None
@@ -136,8 +194,7 @@ class TestProfileSelectScreen:
 class TestConfirmationScreen:
     """Tests the ConfirmationScreen."""
 
-    @pytest.mark.asyncio
-    async def test_confirmation_screen_init_and_compose(self):
+    def test_confirmation_screen_init_and_compose(self):
         """Tests initialization and composition of the ConfirmationScreen."""
         screen = ConfirmationScreen(message="Are you sure?")
         assert screen.message == "Are you sure?"
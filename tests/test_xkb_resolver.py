@@ -1,23 +1,49 @@
 """Unit tests for the xkb_resolver module."""
 
+import copy
 from unittest.mock import patch, MagicMock
 
 import pytest
 from textype.xkb_resolver import XKBResolver
 
 
+class XKBModifierDoesNotExist(Exception):
+    """Stand-in for the xkbcommon error raised for unknown modifier names."""
+
+
+def _build_xkb_template():
+    """Builds a mock xkb module with the context/keymap/state chain wired up."""
+    mock = MagicMock()
+    mock.XKBModifierDoesNotExist = XKBModifierDoesNotExist
+    keymap = mock.Context.return_value.keymap_new_from_names.return_value
+    keymap.state_new.return_value = MagicMock()
+    return mock
+
+
+_XKB_TEMPLATE = _build_xkb_template()
+"""Mock xkb module built once and deep-copied into each test."""
+
+
 @pytest.fixture
 def mock_xkb():
-    """Mocks the xkbcommon library for testing."""
-    with patch("textype.xkb_resolver.xkb") as mock:
+    """Mocks the xkbcommon library for testing with a fresh copy of the template."""
+    mock = copy.deepcopy(_XKB_TEMPLATE)
+    with patch("textype.xkb_resolver.xkb", new=mock):
         yield mock
 
 
+@pytest.fixture
+def mock_state(mock_xkb):
+    """Provides the XKB state the resolver creates on first use."""
+    keymap = mock_xkb.Context.return_value.keymap_new_from_names.return_value
+    return keymap.state_new.return_value
+
+
 class TestXKBResolver:
     """Tests the XKBResolver class for keycode-to-character mapping."""
 
     def test_init(self, mock_xkb):
-        """Tests that the XKBResolver initializes correctly."""
+        """Tests that the XKBResolver defers XKB setup until first use."""
         mock_context = MagicMock()
         mock_keymap = MagicMock()
         mock_state = MagicMock()
@@ -28,6 +54,12 @@ class TestXKBResolver:
 
         resolver = XKBResolver()
 
+        mock_xkb.Context.assert_not_called()
+        assert resolver.state is None
+
+        resolver.resolve(30)
+        resolver.update_modifiers(shift=True)
+
         mock_xkb.Context.assert_called_once()
         mock_context.keymap_new_from_names.assert_called_once()
         mock_keymap.state_new.assert_called_once()
@@ -35,55 +67,100 @@ class TestXKBResolver:
         assert resolver.keymap == mock_keymap
         assert resolver.state == mock_state
 
-    def test_resolve_simple_key(self, mock_xkb):
+    def test_resolve_simple_key(self, mock_xkb, mock_state):
         """Tests resolving a simple key without modifiers."""
         resolver = XKBResolver()
 
         # Mock the key_get_one_sym and keysym_to_string methods
-        resolver.state.key_get_one_sym.return_value = 1
+        mock_state.key_get_one_sym.return_value = 1
         mock_xkb.keysym_to_string.return_value = "a"
 
         result = resolver.resolve(30)  # KEY_A scancode
 
         assert result == "a"
-        resolver.state.key_get_one_sym.assert_called_once_with(38)  # 30 + 8
+        mock_state.key_get_one_sym.assert_called_once_with(38)  # 30 + 8
 
     def test_resolve_shifted_key(self, mock_xkb):
         """Tests resolving a key with the Shift modifier."""
+        keymap = mock_xkb.Context.return_value.keymap_new_from_names.return_value
+        keymap.mod_get_index.return_value = 1  # Mock "Shift" index
         resolver = XKBResolver()
 
-        resolver.keymap.mod_get_index.return_value = 1  # Mock "Shift" index
-        resolver.state.key_get_one_sym.return_value = 2
+        keymap.state_new.return_value.key_get_one_sym.return_value = 2
         mock_xkb.keysym_to_string.return_value = "A"
 
         resolver.update_modifiers(shift=True)
         result = resolver.resolve(30)
 
         assert result == "A"
-        resolver.state.update_mask.assert_called()
+        resolver.state.update_mask.assert_called_once_with(1 << 1, 0, 0, 0, 0, 0)
 
     def test_resolve_altgr_key(self, mock_xkb):
         """Tests resolving a key with the AltGr modifier."""
+        keymap = mock_xkb.Context.return_value.keymap_new_from_names.return_value
+        keymap.mod_get_index.return_value = 2  # Mock "Mod5" index
         resolver = XKBResolver()
 
-        resolver.keymap.mod_get_index.return_value = 2  # Mock "ISO_Level3_Shift" index
-        resolver.state.key_get_one_sym.return_value = 3
+        keymap.state_new.return_value.key_get_one_sym.return_value = 3
         mock_xkb.keysym_to_string.return_value = "á"
 
         resolver.update_modifiers(altgr=True)
         result = resolver.resolve(30)
 
         assert result == "á"
-        resolver.state.update_mask.assert_called()
+        resolver.state.update_mask.assert_called_once_with(1 << 2, 0, 0, 0, 0, 0)
+
+    def test_modifier_indices_resolved_once(self, mock_xkb):
+        """Tests that modifier indices are looked up once, not per update."""
+        resolver = XKBResolver()
+        resolver.update_modifiers(shift=True, altgr=True)
+        lookups = resolver.keymap.mod_get_index.call_count
 
-    def test_resolve_no_symbol(self, mock_xkb):
+        resolver.update_modifiers(shift=False)
+
+        assert resolver.keymap.mod_get_index.call_count == lookups
+
+    def test_unknown_modifier_falls_back(self, mock_xkb):
+        """Tests that modifiers missing from the keymap contribute no bit."""
+        keymap = mock_xkb.Context.return_value.keymap_new_from_names.return_value
+
+        def mod_get_index(name):
+            if name != "Shift":
+                raise XKBModifierDoesNotExist(name)
+            return 0
+
+        keymap.mod_get_index.side_effect = mod_get_index
+        resolver = XKBResolver()
+
+        resolver.update_modifiers(shift=True, altgr=True)
+
+        resolver.state.update_mask.assert_called_once_with(1, 0, 0, 0, 0, 0)
+
+    def test_resolve_no_symbol(self, mock_xkb, mock_state):
         """Tests resolving a key that has no symbol."""
         resolver = XKBResolver()
 
         # Configure the mock to return NoSymbol
         mock_xkb.lib.XKB_KEY_NoSymbol = 0
-        resolver.state.key_get_one_sym.return_value = 0
+        mock_state.key_get_one_sym.return_value = 0
 
         result = resolver.resolve(1)  # KEY_ESCAPE scancode
 
         assert result is None
+
+    def test_resolve_cached_per_modifier_state(self, mock_xkb):
+        """Tests that repeated lookups reuse the result for the same modifiers."""
+        keymap = mock_xkb.Context.return_value.keymap_new_from_names.return_value
+        keymap.mod_get_index.return_value = 1
+        resolver = XKBResolver()
+        mock_xkb.keysym_to_string.side_effect = ["a", "A"]
+
+        assert resolver.resolve(30) == "a"
+        resolver.update_modifiers(shift=True)
+        assert resolver.resolve(30) == "A"
+        resolver.update_modifiers(shift=False)
+        assert resolver.resolve(30) == "a"
+        resolver.update_modifiers(shift=True)
+        assert resolver.resolve(30) == "A"
+
+        assert resolver.state.key_get_one_sym.call_count == 2